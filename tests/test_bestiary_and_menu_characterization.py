@@ -474,3 +474,72 @@ def test_claim_output_is_itemized_in_show_bestiary(monkeypatch) -> None:
         "Resgatado: Colecionador de Varas",
         "  - ✨ +50 XP",
     ]
+
+
+def test_show_main_menu_prints_pending_notice_before_prompt(monkeypatch, capsys) -> None:
+    import utils.pesca as pesca
+
+    pool = _DummyPool(name="Rio", fish_profiles=[], folder=Path("rio"))
+    monkeypatch.setattr(pesca, "use_modern_ui", lambda: False)
+    monkeypatch.setattr(pesca, "clear_screen", lambda: None)
+    monkeypatch.setattr("builtins.input", lambda _prompt="": " 3 ")
+
+    choice = pesca.show_main_menu(pool, 10.0, 1, 0, None, None, notice="Opção inválida.")
+
+    assert choice == "3"
+    output = capsys.readouterr().out
+    assert output.rstrip().endswith("Opção inválida.")
+
+
+def test_print_spaced_lines_splits_numbered_options_for_modern_panel(monkeypatch) -> None:
+    import utils.ui as ui
+
+    captured: dict[str, object] = {}
+
+    def fake_panel(title, *, header_lines, options, prompt, show_badge):
+        captured["title"] = title
+        captured["headers"] = header_lines
+        captured["options"] = [(option.key, option.label) for option in options]
+
+    monkeypatch.setattr(ui, "use_modern_ui", lambda: True)
+    monkeypatch.setattr(ui, "print_menu_panel", fake_panel)
+
+    ui.print_spaced_lines(
+        [
+            "=== Loja ===",
+            "Saldo: 10.5",
+            "1. Comprar",
+            "  12.   Vender  ",
+            "3.",
+            "a. Sair",
+        ]
+    )
+
+    assert captured["title"] == " Loja "
+    assert captured["headers"] == ["Saldo: 10.5", "3.", "a. Sair"]
+    assert captured["options"] == [("1", "Comprar"), ("12", "Vender")]
+
+
+def test_clear_screen_writes_ansi_clear_outside_windows(monkeypatch, capsys) -> None:
+    import utils.ui as ui
+
+    def fail_system(_command: str) -> int:
+        raise AssertionError("clear_screen nao deve abrir um shell.")
+
+    monkeypatch.setattr(ui.os, "name", "posix")
+    monkeypatch.setattr(ui.os, "system", fail_system)
+
+    ui.clear_screen()
+
+    assert capsys.readouterr().out == "\x1b[H\x1b[2J\x1b[3J"
+
+
+def test_print_spaced_lines_legacy_output_characterization(monkeypatch, capsys) -> None:
+    import utils.ui as ui
+
+    monkeypatch.setattr(ui, "use_modern_ui", lambda: False)
+
+    ui.print_spaced_lines(iter(["=== Loja ===", "1. Comprar"]), gap_lines=2)
+    ui.print_spaced_lines([])
+
+    assert capsys.readouterr().out == "=== Loja ===\n\n1. Comprar\n"
@@ -1,12 +1,30 @@
 from __future__ import annotations
 
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
 
-from utils.pesca import FishProfile, load_hunts, load_pools
+from utils.pesca import (
+    FishProfile,
+    FishingPool,
+    _apply_luck_to_weights,
+    _build_rarity_rank,
+    _build_alias_table,
+    combine_rarity_weights_raw,
+    load_hunts,
+    load_pools,
+    normalize_rarity_weights,
+)
 from utils.events import EventDefinition, EventManager
 from utils.hunts import HuntDefinition, HuntManager
-from utils.pesca_round_helpers import combine_fish_profiles
+from utils.baits import BaitDefinition
+from utils.pesca_round_helpers import (
+    calculate_effective_rod_stats,
+    combine_fish_profiles,
+    filter_eligible_fish,
+    resolve_active_bait,
+)
+from utils.pesca_inventory_helpers import sanitize_equipped_bait
 
 
 def _event(
@@ -661,3 +679,196 @@ def test_coroa_de_espinhos_hunt_loads_for_grandreef(tmp_path: Path) -> None:
     assert "coroa_de_espinhos" in repo_hunts
     assert repo_hunts["coroa_de_espinhos"].pool_name == "Grande Recife"
     assert repo_hunts["coroa_de_espinhos"].rarity_weights.get("Lendario", 0) > 0
+
+
+def test_alias_table_reproduces_rarity_weights_characterization() -> None:
+    weights = [60.0, 25.0, 10.0, 5.0, 0.0]
+    prob, alias = _build_alias_table(weights)
+
+    count = len(weights)
+    implied = [value / count for value in prob]
+    for index, target in enumerate(alias):
+        if target != index:
+            implied[target] += (1.0 - prob[index]) / count
+
+    total = sum(weights)
+    for index, weight in enumerate(weights):
+        assert abs(implied[index] - weight / total) < 1e-9
+
+
+def test_combine_rarity_weights_raw_keeps_proportions_characterization() -> None:
+    combined = combine_rarity_weights_raw(
+        {"Comum": 70, "Raro": 30},
+        {"Raro": 40, "Lendario": 10, "Fora": 50},
+        ["Comum", "Raro", "Lendario"],
+    )
+
+    assert list(combined) == ["Comum", "Raro", "Lendario"]
+    assert abs(sum(combined.values()) - 100) < 1e-9
+    assert abs(combined["Comum"] - 70 / 150 * 100) < 1e-9
+    assert abs(combined["Raro"] - 70 / 150 * 100) < 1e-9
+    assert abs(combined["Lendario"] - 10 / 150 * 100) < 1e-9
+
+
+def test_pool_combined_rarity_weights_are_cached_per_combination_characterization() -> None:
+    pool = FishingPool(
+        name="Rio",
+        major_area=None,
+        fish_profiles=[_fish("A", rarity="Comum"), _fish("B", rarity="Raro")],
+        folder=Path("rio"),
+        description="",
+        rarity_weights={"Comum": 80, "Raro": 20},
+    )
+    event_weights = {"Raro": 100}
+    rarities = frozenset({"Comum", "Raro"})
+
+    combined = pool.combined_rarity_weights(rarities, event_weights)
+
+    assert combined == {"Comum": 40.0, "Raro": 60.0}
+    assert pool.combined_rarity_weights(rarities, event_weights) is combined
+    assert pool.combined_rarity_weights(rarities) == {"Comum": 80, "Raro": 20}
+
+
+def test_apply_luck_ranks_present_rarities_by_xp_characterization() -> None:
+    adjusted = _apply_luck_to_weights({"Lendario": 10, "Comum": 60, "Estranha": 30}, 0.5)
+
+    # Estranha (fora de RARITY_XP) fica abaixo de Comum; Lendario e o topo.
+    assert list(adjusted) == ["Lendario", "Comum", "Estranha"]
+    assert abs(adjusted["Estranha"] - 30 * 100 / 130) < 1e-9
+    assert abs(adjusted["Comum"] - 82.5 * 100 / 130) < 1e-9
+    assert abs(adjusted["Lendario"] - 17.5 * 100 / 130) < 1e-9
+
+
+def test_apply_luck_keeps_weight_order_for_tied_xp_characterization() -> None:
+    ranks, unknown_rank = _build_rarity_rank({"Comum": 10, "Gemeo": 10, "Raro": 35})
+    assert ranks == {"Comum": 1, "Gemeo": 1, "Raro": 2}
+    assert unknown_rank == 0
+
+    # Bizarra e Estranha empatam (fora de RARITY_XP): vale a ordem dos pesos.
+    adjusted = _apply_luck_to_weights({"Bizarra": 30, "Comum": 40, "Estranha": 30}, 0.5)
+    scale = 100 / 141.25
+    assert abs(adjusted["Bizarra"] - 30 * scale) < 1e-9
+    assert abs(adjusted["Estranha"] - 41.25 * scale) < 1e-9
+    assert abs(adjusted["Comum"] - 70 * scale) < 1e-9
+
+    swapped = _apply_luck_to_weights({"Estranha": 30, "Comum": 40, "Bizarra": 30}, 0.5)
+    assert abs(swapped["Estranha"] - 30 * scale) < 1e-9
+    assert abs(swapped["Bizarra"] - 41.25 * scale) < 1e-9
+
+
+def test_round_helpers_never_hand_out_the_pool_list_characterization() -> None:
+    pool = FishingPool(
+        name="Rio",
+        major_area=None,
+        fish_profiles=[_fish("A", kg_min=1.0), _fish("B", kg_min=8.0)],
+        folder=Path("rio"),
+        description="",
+        rarity_weights={"Raro": 100},
+    )
+
+    combined = combine_fish_profiles(pool, None, [])
+    assert combined == pool.fish_profiles
+    assert combined is not pool.fish_profiles
+    eligible = filter_eligible_fish(combined, kg_max=10.0)
+    assert eligible == combined and eligible is not combined
+    eligible.clear()
+    assert [fish.name for fish in pool.fish_profiles] == ["A", "B"]
+
+    filtered = filter_eligible_fish(combined, kg_max=5.0)
+    assert [fish.name for fish in filtered] == ["A"]
+    assert pool.choose_fish(combined, 0.0).name in {"A", "B"}
+
+    everything = pool.eligible_for(10.0)
+    assert isinstance(everything, tuple)
+    assert list(everything) == pool.fish_profiles
+    assert pool.eligible_for(10.0) is everything
+    assert pool.choose_fish(everything, 0.0).name in {"A", "B"}
+    assert pool.eligible_for(5.0) is pool.eligible_for(5.0)
+    assert [fish.name for fish in pool.eligible_for(5.0)] == ["A"]
+
+
+def test_load_pools_reads_json_without_writing_cache_characterization(
+    tmp_path: Path,
+) -> None:
+    import json as _json
+
+    pool_dir = tmp_path / "lagoa"
+    fish_dir = pool_dir / "fish"
+    fish_dir.mkdir(parents=True)
+    (pool_dir / "pool.json").write_text(
+        _json.dumps({"name": "Lagoa", "rarity_chances": {"Comum": 100}}),
+        encoding="utf-8",
+    )
+    fish_path = fish_dir / "lambari.json"
+    fish_data = {
+        "name": "Lambari",
+        "rarity": "Comum",
+        "kg_min": 1.0,
+        "kg_max": 2.0,
+        "base_value": 10,
+    }
+    fish_path.write_text(_json.dumps(fish_data), encoding="utf-8")
+
+    pools = load_pools(tmp_path)
+    assert [fish.name for fish in pools[0].fish_profiles] == ["Lambari"]
+    # Nada de cache em disco: o diretorio de conteudo fica so com os JSON.
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["lagoa"]
+
+    fish_data["name"] = "Lambari Rabo Vermelho"
+    fish_path.write_text(_json.dumps(fish_data), encoding="utf-8")
+    reloaded = load_pools(tmp_path)
+    assert [fish.name for fish in reloaded[0].fish_profiles] == ["Lambari Rabo Vermelho"]
+
+
+def test_normalize_rarity_weights_integer_and_fractional_splits_characterization() -> None:
+    assert normalize_rarity_weights(
+        {"Raro": 30, "Comum": 70, "Mitico": 5},
+        ["Comum", "Raro"],
+    ) == {"Raro": 30, "Comum": 70}
+    assert normalize_rarity_weights(
+        {"Comum": 1, "Raro": 1, "Epico": 1},
+        ["Comum", "Epico", "Raro"],
+    ) == {"Comum": 34, "Raro": 33, "Epico": 33}
+
+
+def test_effective_rod_stats_with_and_without_bait_characterization() -> None:
+    rod = SimpleNamespace(control=0.5, luck=0.1, kg_max=-3.0)
+    bait = BaitDefinition(
+        bait_id="minhoca",
+        crate_id="basica",
+        name="Minhoca",
+        control=0.25,
+        luck=0.2,
+        kg_plus=10.0,
+        rarity="Comum",
+    )
+
+    assert calculate_effective_rod_stats(rod, None) == (0.5, 0.1, 0.01)
+    control, luck, kg_max = calculate_effective_rod_stats(rod, bait)
+    assert (control, kg_max) == (0.75, 7.0)
+    assert abs(luck - 0.3) < 1e-9
+
+
+def test_resolve_and_sanitize_equipped_bait_characterization() -> None:
+    bait = BaitDefinition(
+        bait_id="basica/minhoca",
+        crate_id="basica",
+        name="Minhoca",
+        control=0.0,
+        luck=0.0,
+        kg_plus=0.0,
+        rarity="Comum",
+    )
+    bait_by_id = {bait.bait_id: bait}
+
+    inventory = {"basica/minhoca": 3}
+    assert resolve_active_bait(inventory, bait_by_id, "basica/minhoca") == ("basica/minhoca", bait, 3)
+    assert sanitize_equipped_bait("basica/minhoca", inventory, bait_by_id) == "basica/minhoca"
+    assert resolve_active_bait(inventory, bait_by_id, None) == (None, None, 0)
+
+    inventory = {"basica/minhoca": 0, "sumida": 2}
+    assert sanitize_equipped_bait("basica/minhoca", inventory, bait_by_id) is None
+    assert sanitize_equipped_bait("sumida", inventory, bait_by_id) is None
+    assert resolve_active_bait(inventory, bait_by_id, "sumida") == (None, None, 0)
+    assert resolve_active_bait(inventory, bait_by_id, "basica/minhoca") == (None, None, 0)
+    assert inventory == {}
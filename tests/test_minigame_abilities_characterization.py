@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 from utils.pesca import (
+    FISHING_FRAME_INTERVAL_S,
     FishingAttempt,
     FishingMiniGame,
+    KeyStream,
     _build_fishing_minigame,
+    _next_frame_deadline,
     _render_colored_segment,
 )
 from utils.rods import Rod
@@ -121,6 +124,27 @@ def test_curse_activates_with_guaranteed_chance_characterization(monkeypatch) ->
     assert game.get_ability_counter_text() == "Curse! -0.6s"
 
 
+def test_curse_timeout_uses_the_keypress_timestamp_characterization(monkeypatch) -> None:
+    monkeypatch.setattr("utils.pesca.random.random", lambda: 0.0)
+
+    game = _make_game(
+        ["a", "b"],
+        can_curse=True,
+        curse_chance=1.0,
+        curse_time_penalty=5.0,
+    )
+    # O relogio real nao deve ser consultado de novo dentro do mesmo handle_key.
+    monkeypatch.setattr("utils.pesca.time.perf_counter", lambda: game.start_time)
+
+    now = game.start_time + 27.0
+    result = game.handle_key("a", now=now)
+
+    assert result is not None
+    assert result.success is False
+    assert result.reason == "Tempo esgotado"
+    assert result.elapsed_s == 27.0
+
+
 def test_curse_and_slam_stack_as_net_time_delta_characterization(monkeypatch) -> None:
     rolls = iter([0.0, 0.0])
     monkeypatch.setattr("utils.pesca.random.random", lambda: next(rolls))
@@ -146,7 +170,8 @@ def test_curse_and_slam_stack_as_net_time_delta_characterization(monkeypatch) ->
 def test_curse_causes_immediate_timeout_when_penalty_exhausts_time_characterization(
     monkeypatch,
 ) -> None:
-    perf_values = iter([0.0, 0.05, 0.25])
+    # Tecla em 0.15s: ainda dentro dos 0.2s, mas fora do prazo apos o Curse (-0.1s).
+    perf_values = iter([0.0, 0.15])
     monkeypatch.setattr("utils.pesca.time.perf_counter", lambda: next(perf_values))
     monkeypatch.setattr("utils.pesca.random.random", lambda: 0.0)
 
@@ -368,3 +393,98 @@ def test_build_fishing_minigame_includes_rod_abilities_by_default_characterizati
     assert game.pierce_chance == 0.6
     assert game.can_greed is True
     assert game.greed_chance == 0.2
+
+
+def test_remaining_sequence_text_tracks_progress_and_cuts_characterization() -> None:
+    game = _make_game(["a", "b", "c", "d"])
+
+    assert game.remaining_sequence_text() == "A B C D"
+    game.handle_key("a")
+    assert game.remaining_sequence_text() == "B C D"
+
+    game.attempt.sequence.pop()
+    assert game.remaining_sequence_text() == "B C"
+
+
+def test_minigame_uses_caller_supplied_frame_time_characterization(monkeypatch) -> None:
+    monkeypatch.setattr("utils.pesca.time.perf_counter", lambda: 10.0)
+    attempt = FishingAttempt(
+        sequence=["a", "b"],
+        time_limit_s=2.0,
+        allowed_keys=list("abcdefghijklmnopqrstuvwxyz"),
+    )
+    game = FishingMiniGame(attempt)
+    game.begin()
+
+    assert game.handle_key("a", 11.0) is None
+    assert game.time_left(11.5) == 0.5
+    assert game.check_timeout(11.9) is None
+
+    result = game.check_timeout(12.5)
+    assert result is not None
+    assert result.reason == "Tempo esgotado"
+    assert result.elapsed_s == 2.5
+
+
+def test_keystream_wait_keys_returns_pending_keys_or_times_out_characterization() -> None:
+    stream = KeyStream()
+
+    assert stream.wait_keys(0.0) == []
+
+    stream._push("w")
+    stream._push("a")
+    assert stream.wait_keys(0.5) == ["w", "a"]
+    assert stream.pop_all() == []
+
+
+def test_next_frame_deadline_keeps_cadence_and_reanchors_when_late_characterization() -> None:
+    assert _next_frame_deadline(1.0, 0.99) == 1.0
+    assert _next_frame_deadline(1.0, 1.001) == 1.0 + FISHING_FRAME_INTERVAL_S
+    assert _next_frame_deadline(1.0, 1.5) == 1.5 + FISHING_FRAME_INTERVAL_S
+
+
+def test_keystream_drops_keys_outside_accepted_set_characterization(monkeypatch) -> None:
+    from types import SimpleNamespace
+
+    captured = {}
+
+    class _Listener:
+        def __init__(self, on_press) -> None:
+            captured["on_press"] = on_press
+
+        def start(self) -> None:
+            pass
+
+        def stop(self) -> None:
+            pass
+
+    fake_keyboard = SimpleNamespace(Listener=_Listener, Key=SimpleNamespace(esc=object()))
+    monkeypatch.setattr("utils.pesca.importlib.import_module", lambda _name: fake_keyboard)
+
+    stream = KeyStream(accepted_keys=frozenset("wasd"))
+    stream.start()
+    for ch in ("W", "x", "d", "1"):
+        captured["on_press"](SimpleNamespace(char=ch))
+    assert stream.pop_all() == ["w", "d"]
+
+    stream.accept_only(frozenset("x"))
+    captured["on_press"](SimpleNamespace(char="x"))
+    captured["on_press"](SimpleNamespace(char="w"))
+    assert stream.pop_all() == ["x"]
+    stream.stop()
+
+
+def test_keystream_start_without_pynput_ends_round_instead_of_raising_characterization(
+    monkeypatch,
+    capsys,
+) -> None:
+    def _missing(_name):
+        raise ImportError("No module named 'pynput'")
+
+    monkeypatch.setattr("utils.pesca.importlib.import_module", _missing)
+
+    stream = KeyStream()
+    stream.start()
+    assert stream.stop_requested() is True
+    assert "pynput" in capsys.readouterr().out
+    stream.stop()
@@ -95,3 +95,5 @@ def test_render_fishing_hud_line_perfect_marker_characterization() -> None:
 
     assert "Perfect: ON" in hud_on
     assert "Perfect: OFF" in hud_off
+    assert "[" + "=" * 16 + "." * 4 + "]" in hud_on
+    assert "[" + "=" * 2 + "." * 18 + "]" in hud_off
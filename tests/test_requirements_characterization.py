@@ -7,6 +7,7 @@ from utils.crafting import (
     CraftingDefinition,
     CraftingProgress,
     CraftingState,
+    count_inventory_fish_and_mutations,
     deliver_inventory_entry_for_craft,
     format_crafting_requirement,
     has_any_pool_bestiary_full_completion,
@@ -34,6 +35,13 @@ from utils.missions import (
     restore_mission_progress,
     update_mission_completions,
 )
+from utils.requirements_common import (
+    collect_countable_fish_names,
+    count_fish_mutation_pair,
+    count_name_case_insensitive,
+    fish_name_matches,
+    seconds_from_requirement,
+)
 
 
 @dataclass
@@ -1207,3 +1215,68 @@ def test_retribuicao_crafting_recipe_loads_correctly(tmp_path: Path) -> None:
     assert "retribuicao_craft" in repo_definitions
     assert repo_definitions["retribuicao_craft"].rod_name == "Retribuição"
     assert len(repo_definitions["retribuicao_craft"].craft_requirements) == 5
+
+
+def test_count_inventory_fish_and_mutations_single_pass_characterization() -> None:
+    inventory = [
+        InventoryEntry(name="Tilapia", rarity="Comum", kg=1.0, base_value=10.0),
+        InventoryEntry(
+            name="Tilapia",
+            rarity="Comum",
+            kg=2.0,
+            base_value=10.0,
+            mutation_name="Albino",
+        ),
+        InventoryEntry(name="Pacu", rarity="Raro", kg=3.0, base_value=30.0),
+    ]
+
+    fish_counts, mutation_counts = count_inventory_fish_and_mutations(inventory)
+
+    assert fish_counts == {"Tilapia": 2, "Pacu": 1}
+    assert mutation_counts == {"Albino": 1}
+
+
+def test_case_insensitive_count_helpers_characterization() -> None:
+    counts = {"Tilapia": 2, "TILAPIA": 1, "Robalo": 4}
+    assert count_name_case_insensitive(counts, "tilapia") == 3
+    assert count_name_case_insensitive(counts, "Dourado") == 0
+
+    pairs = {"Tilapia::Dourada": 2, "tilapia::dourada": 1, "Robalo::Dourada": 5, "semseparador": 9}
+    assert count_fish_mutation_pair(pairs, fish_name="TILAPIA", mutation_name="Dourada") == 2
+    assert count_fish_mutation_pair(
+        pairs,
+        fish_name="TILAPIA",
+        mutation_name="DOURADA",
+        mutation_case_insensitive=True,
+    ) == 3
+    assert count_fish_mutation_pair(pairs, fish_name=None, mutation_name="Dourada") == 7
+
+    assert fish_name_matches("Tilapia", "Tilapia")
+    assert fish_name_matches("Tilapia", "TILAPIA")
+    assert not fish_name_matches("Tilapia", "Robalo")
+
+
+def test_seconds_from_requirement_key_priority_characterization() -> None:
+    assert seconds_from_requirement({"seconds": 30, "minutes": 2}) == 30.0
+    assert seconds_from_requirement({"minutes": "1.5", "hours": 1}) == 90.0
+    assert seconds_from_requirement({"hours": 2}) == 7200.0
+    assert seconds_from_requirement({"time_seconds": 45}) == 45.0
+    assert seconds_from_requirement({"seconds": None, "hours": 1}) == 0.0
+    assert seconds_from_requirement({"minutes": -1}) == -60.0
+    assert seconds_from_requirement({"minutes": -1}, clamp_non_negative=True) == 0.0
+    assert seconds_from_requirement({}) == 0.0
+
+
+def test_collect_countable_fish_names_skips_malformed_entries_characterization() -> None:
+    from types import SimpleNamespace
+
+    pool = SimpleNamespace(
+        name="Lagoa",
+        fish_profiles=[
+            SimpleNamespace(name="Tilapia"),
+            SimpleNamespace(name="Oculto", counts_for_bestiary_completion=False),
+            SimpleNamespace(name=42),
+            SimpleNamespace(rarity="Comum"),
+        ],
+    )
+    assert collect_countable_fish_names([pool]) == {"Tilapia"}
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 from types import SimpleNamespace
 
 from utils.baits import BaitDefinition
 from utils.inventory import InventoryEntry
+from utils.pesca_autosave import SaveWriter
 from utils.rods import Rod
 from utils.rod_upgrades import restore_rod_upgrade_state
 from utils.rod_upgrades import _UPGRADE_RECIPE_BALANCE_VERSION
 from utils.save_system import (
     SAVE_VERSION,
+    index_pools_by_name,
     load_game,
     restore_bait_inventory,
     restore_balance,
@@ -25,6 +28,7 @@ from utils.save_system import (
     restore_unlocked_pools,
     restore_xp,
     save_game,
+    write_save_payload,
 )
 from utils.rod_upgrades import UpgradeRequirement
 
@@ -150,12 +154,10 @@ def test_save_load_roundtrip_with_restore_helpers(tmp_path: Path) -> None:
     assert raw["version"] == SAVE_VERSION
     assert raw["equipped_bait"] == "cheap/minhoca"
     assert raw["bait_inventory"] == {"cheap/minhoca": 3, "invalid": 2}
-    assert raw["inventory"][0]["is_shiny"] is True
-    assert raw["inventory"][1]["is_shiny"] is False
-    assert raw["inventory"][0]["is_unsellable"] is True
-    assert raw["inventory"][1]["is_unsellable"] is False
-    assert raw["storage"][0]["name"] == "Pirarucu"
-    assert raw["storage"][0]["mutation_name"] == "Noir"
+    assert raw["inventory"]["is_shiny"] == [True, False]
+    assert raw["inventory"]["is_unsellable"] == [True, False]
+    assert raw["storage"]["name"] == ["Pirarucu"]
+    assert raw["storage"]["mutation_name"] == ["Noir"]
     assert raw["rod_upgrades"] == {
         "bonuses": {"Vara Carbono": {"luck": 0.12, "kg_max": 0.08}},
         "recipes": {
@@ -196,6 +198,15 @@ def test_save_load_roundtrip_with_restore_helpers(tmp_path: Path) -> None:
     assert "Lagoa Tranquila" in restored_unlocked_pools
     assert "Rio Correnteza" in restored_unlocked_pools
 
+    pools_by_name = index_pools_by_name(pools)
+    assert restore_selected_pool(
+        raw["selected_pool"], pools, pools[1], pools_by_name=pools_by_name
+    ) is selected_pool
+    assert restore_selected_pool(None, pools, pools[1], pools_by_name=pools_by_name) is pools[1]
+    assert restore_unlocked_pools(
+        raw["unlocked_pools"], pools, restored_selected_pool, pools_by_name=pools_by_name
+    ) == restored_unlocked_pools
+
     restored_equipped_rod = restore_equipped_rod(raw["equipped_rod"], restored_owned, starter_rod)
     assert restored_equipped_rod.name == "Vara Carbono"
 
@@ -321,3 +332,213 @@ def test_restore_storage_defaults_empty_and_skips_invalid_entries() -> None:
     assert len(restored) == 1
     assert restored[0].name == "Tilapia"
 
+
+
+def test_load_game_reads_legacy_indented_save(tmp_path: Path) -> None:
+    save_path = tmp_path / "savegame.json"
+    save_path.write_text(
+        '{\n  "version": 10,\n  "balance": 12.5,\n  "discovered_fish": ["Tilápia"]\n}',
+        encoding="utf-8",
+    )
+
+    raw = load_game(save_path)
+
+    assert raw == {"version": 10, "balance": 12.5, "discovered_fish": ["Tilápia"]}
+
+
+def test_save_writer_flush_persists_latest_snapshot(tmp_path: Path) -> None:
+    save_path = tmp_path / "savegame.json"
+    writer = SaveWriter()
+
+    writer.submit(save_path, b'{"balance":1}')
+    writer.submit(save_path, b'{"balance":2}')
+    writer.flush()
+
+    assert load_game(save_path) == {"balance": 2}
+
+
+def test_save_writer_flush_reports_timeout_while_write_is_blocked(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    release = threading.Event()
+    writes: list[bytes] = []
+
+    def _blocked_write(_save_path: Path, payload: bytes) -> None:
+        release.wait(5)
+        writes.append(payload)
+
+    monkeypatch.setattr("utils.pesca_autosave.write_save_payload", _blocked_write)
+    writer = SaveWriter()
+    writer.submit(tmp_path / "savegame.json", b"{}")
+
+    assert writer.flush(timeout_s=0.05) is False
+    release.set()
+    assert writer.flush() is True
+    assert writes == [b"{}"]
+
+
+def _wait_writer_idle(writer: SaveWriter) -> None:
+    # Espera a thread sem passar pelo flush(), que consumiria o erro.
+    with writer._condition:
+        assert writer._condition.wait_for(
+            lambda: writer._pending is None and not writer._writing,
+            timeout=5,
+        )
+
+
+def test_save_writer_reports_failed_write_on_next_submit(tmp_path: Path, monkeypatch) -> None:
+    import pytest
+
+    outcomes: list[bool] = [False, True]
+    writes: list[bytes] = []
+
+    def _flaky_write(_save_path: Path, payload: bytes) -> None:
+        if not outcomes.pop(0):
+            raise OSError("disco cheio")
+        writes.append(payload)
+
+    monkeypatch.setattr("utils.pesca_autosave.write_save_payload", _flaky_write)
+    writer = SaveWriter()
+    save_path = tmp_path / "savegame.json"
+
+    writer.submit(save_path, b"1")
+    _wait_writer_idle(writer)
+    with pytest.raises(OSError, match="disco cheio"):
+        writer.submit(save_path, b"2")
+    # O snapshot novo continua na fila mesmo com o erro reportado.
+    assert writer.flush(timeout_s=5) is True
+    assert writes == [b"2"]
+
+
+def test_save_writer_clears_error_after_a_later_write_succeeds(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    started = threading.Event()
+    release = threading.Event()
+    writes: list[bytes] = []
+
+    def _write(_save_path: Path, payload: bytes) -> None:
+        if payload == b"1":
+            started.set()
+            release.wait(5)
+            raise OSError("sem permissao")
+        writes.append(payload)
+
+    monkeypatch.setattr("utils.pesca_autosave.write_save_payload", _write)
+    writer = SaveWriter()
+    save_path = tmp_path / "savegame.json"
+
+    writer.submit(save_path, b"1")
+    assert started.wait(5)
+    writer.submit(save_path, b"2")
+    release.set()
+
+    assert writer.flush(timeout_s=5) is True
+    assert writes == [b"2"]
+
+
+def test_autosave_debounce_only_holds_storage_saves(tmp_path: Path, monkeypatch) -> None:
+    import utils.pesca_autosave as pesca_autosave
+
+    saves: list[float] = []
+    clock = iter([100.0, 101.0, 102.0, 103.0])
+    monkeypatch.setattr(pesca_autosave.time, "monotonic", lambda: next(clock))
+    monkeypatch.setattr(pesca_autosave, "_last_autosave_at", None)
+    monkeypatch.setattr(pesca_autosave, "_autosave_dirty", False)
+    monkeypatch.setattr(pesca_autosave, "save_game", lambda *_args, **kwargs: saves.append(kwargs["balance"]))
+    for serializer in (
+        "serialize_mission_state",
+        "serialize_mission_progress",
+        "serialize_crafting_state",
+        "serialize_crafting_progress",
+        "serialize_pool_market_orders",
+        "serialize_cosmetics_state",
+    ):
+        monkeypatch.setattr(pesca_autosave, serializer, lambda _value: {})
+
+    def autosave(balance: float, *, debounce: bool = False) -> None:
+        pesca_autosave.autosave_state(
+            tmp_path / "savegame.json",
+            balance,
+            [],
+            [],
+            {},
+            [],
+            None,
+            None,
+            None,
+            set(),
+            set(),
+            1,
+            0,
+            set(),
+            None,
+            None,
+            None,
+            None,
+            None,
+            None,
+            None,
+            None,
+            None,
+            lambda _state: {},
+            debounce=debounce,
+        )
+
+    autosave(1.0, debounce=True)
+    autosave(2.0, debounce=True)
+    assert saves == [1.0]
+    assert pesca_autosave.autosave_pending() is True
+
+    autosave(3.0)
+    assert saves == [1.0, 3.0]
+    assert pesca_autosave.autosave_pending() is False
+
+    autosave(4.0)
+    assert saves == [1.0, 3.0, 4.0]
+
+
+def test_write_save_payload_replaces_file_without_leaving_temp(tmp_path: Path) -> None:
+    save_path = tmp_path / "savegame.json"
+    save_path.write_text('{"balance": 1}', encoding="utf-8")
+
+    write_save_payload(save_path, b'{"balance":2}')
+
+    assert load_game(save_path) == {"balance": 2}
+    assert [path.name for path in tmp_path.iterdir()] == ["savegame.json"]
+
+
+def test_load_game_accepts_utf8_bom_characterization(tmp_path: Path) -> None:
+    save_path = tmp_path / "savegame.json"
+    save_path.write_bytes(b"\xef\xbb\xbf" + '{"version": 1, "balance": 12.5, "selected_pool": "Lagoa"}'.encode("utf-8"))
+
+    assert load_game(save_path) == {"version": 1, "balance": 12.5, "selected_pool": "Lagoa"}
+
+    save_path.write_bytes(b"{nao e json")
+    assert load_game(save_path) is None
+
+
+def test_restore_inventory_reads_columnar_and_legacy_rows_characterization() -> None:
+    columnar = {
+        "name": ["Tilapia", "Pacu", 7],
+        "rarity": ["Comum", "Raro", "Comum"],
+        "kg": [2.0, 3.5, 1.0],
+        "base_value": [10.0, 8.0, 1.0],
+        "is_shiny": [True],
+        "mutation_name": [None, "Noir", None],
+    }
+    restored = restore_inventory(columnar)
+
+    assert [entry.name for entry in restored] == ["Tilapia", "Pacu"]
+    assert restored[0].is_shiny is True
+    assert restored[1].is_shiny is False
+    assert restored[1].mutation_name == "Noir"
+    assert restored[1].mutation_xp_multiplier == 1.0
+
+    legacy = restore_inventory(
+        [{"name": "Tilapia", "rarity": "Comum", "kg": 2.0, "base_value": 10.0}]
+    )
+    assert [entry.name for entry in legacy] == ["Tilapia"]
+    assert restore_inventory({"rarity": ["Comum"]}) == []
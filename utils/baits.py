@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import random
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -190,7 +191,7 @@ def _load_baits_for_crate(crate_id: str, baits_dir: Path) -> List[BaitDefinition
         bait_key = raw_id.strip() if isinstance(raw_id, str) else bait_path.stem
         if not bait_key:
             bait_key = bait_path.stem
-        bait_id = f"{crate_id}/{bait_key}"
+        bait_id = sys.intern(f"{crate_id}/{bait_key}")
 
         baits.append(
             BaitDefinition(
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import json
+from collections import Counter
 from dataclasses import dataclass, field
+from operator import attrgetter
 from pathlib import Path
 from typing import Dict, List, Optional, Sequence, Set, Tuple, TYPE_CHECKING
 
@@ -26,6 +28,8 @@ if TYPE_CHECKING:
 
 
 ANY_KEY = "__any__"
+_ENTRY_NAME = attrgetter("name")
+_ENTRY_MUTATION_NAME = attrgetter("mutation_name")
 
 
 @dataclass
@@ -743,21 +747,18 @@ def _calculate_bestiary_completion(
     return completion_percent(all_fish_names, discovered_fish)
 
 
-def count_inventory_fish(inventory: Sequence[InventoryEntry]) -> Dict[str, int]:
-    counts: Dict[str, int] = {}
-    for entry in inventory:
-        counts[entry.name] = counts.get(entry.name, 0) + 1
-    return counts
-
-
-def count_inventory_mutations(inventory: Sequence[InventoryEntry]) -> Dict[str, int]:
-    counts: Dict[str, int] = {}
-    for entry in inventory:
-        mutation_name = _safe_str(entry.mutation_name)
-        if not mutation_name:
-            continue
-        counts[mutation_name] = counts.get(mutation_name, 0) + 1
-    return counts
+def count_inventory_fish_and_mutations(
+    inventory: Sequence[InventoryEntry],
+) -> Tuple[Dict[str, int], Dict[str, int]]:
+    # Counter sobre colunas extraidas com attrgetter conta no laco em C,
+    # sem acessar cada InventoryEntry pelo interpretador.
+    fish_counts = Counter(map(_ENTRY_NAME, inventory))
+    mutation_counts = Counter(
+        mutation_name
+        for mutation_name in map(_ENTRY_MUTATION_NAME, inventory)
+        if mutation_name and isinstance(mutation_name, str)
+    )
+    return fish_counts, mutation_counts
 
 
 def _pool_matches_name(pool: object, normalized_name: str) -> bool:
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import codecs
+import importlib
+import importlib.util
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Union
+
+
+def _resolve_loads_json_bytes() -> Callable[[bytes], Any]:
+    # orjson e opcional: decodifica UTF-8 e faz o parse em C direto dos bytes.
+    # orjson.JSONDecodeError herda de json.JSONDecodeError, entao os excepts
+    # existentes continuam valendo.
+    if importlib.util.find_spec("orjson"):
+        orjson_loads = importlib.import_module("orjson").loads
+
+        def loads(raw: bytes) -> Any:
+            # Arquivos salvos pelo Bloco de Notas podem vir com BOM.
+            if raw.startswith(codecs.BOM_UTF8):
+                raw = raw[len(codecs.BOM_UTF8):]
+            return orjson_loads(raw)
+
+        return loads
+    # json.loads aceita bytes e detecta a codificacao (inclusive BOM).
+    return json.loads
+
+
+loads_json_bytes = _resolve_loads_json_bytes()
+
+
+_FILE_READ_WORKERS = 8
+_file_read_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _read_file_bytes(path: Path) -> Union[bytes, OSError]:
+    try:
+        return path.read_bytes()
+    except OSError as exc:
+        return exc
+
+
+def read_files_parallel(paths: List[Path]) -> List[Union[bytes, OSError]]:
+    """Lê os arquivos em threads (I/O libera o GIL); o parse continua sequencial."""
+    global _file_read_executor
+    if len(paths) < 2:
+        return [_read_file_bytes(path) for path in paths]
+    # Um executor só para o carregamento todo (varas, peixes, pools);
+    # criar um por pasta custa mais que a leitura.
+    if _file_read_executor is None:
+        _file_read_executor = ThreadPoolExecutor(
+            max_workers=_FILE_READ_WORKERS,
+            thread_name_prefix="json-reader",
+        )
+    return list(_file_read_executor.map(_read_file_bytes, paths))
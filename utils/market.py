@@ -14,8 +14,7 @@ from utils.crafting import (
     CraftingProgress,
     CraftingState,
     apply_craft_submission,
-    count_inventory_fish,
-    count_inventory_mutations,
+    count_inventory_fish_and_mutations,
     deliver_inventory_entry_for_craft,
     format_crafting_requirement,
     get_craft_deliverable_indexes,
@@ -592,10 +591,11 @@ def show_market(
         nonlocal inventory_fish_counts_dirty
         if not inventory_fish_counts_dirty:
             return
+        fish_counts, mutation_counts = count_inventory_fish_and_mutations(inventory)
         inventory_fish_counts_cache.clear()
-        inventory_fish_counts_cache.update(count_inventory_fish(inventory))
+        inventory_fish_counts_cache.update(fish_counts)
         inventory_mutation_counts_cache.clear()
-        inventory_mutation_counts_cache.update(count_inventory_mutations(inventory))
+        inventory_mutation_counts_cache.update(mutation_counts)
         inventory_fish_counts_dirty = False
 
     def _get_inventory_fish_counts() -> Dict[str, int]:
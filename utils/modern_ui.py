@@ -25,6 +25,11 @@ _DEFAULT_BADGE = (
     " ( o.o ) ",
     "  > ^ <  ",
 )
+_HUD_BAR_LEN = 20
+_HUD_TIME_BARS = tuple(
+    ("=" * filled) + ("." * (_HUD_BAR_LEN - filled))
+    for filled in range(_HUD_BAR_LEN + 1)
+)
 _active_accent_color = "#87CEEB"
 _active_icon_color = "#87CEEB"
 _active_badge_lines: Sequence[str] = _DEFAULT_BADGE
@@ -393,9 +398,7 @@ def render_fishing_hud_line(
     remaining_ratio = max(0.0, min(1.0, time_left / total_time))
     elapsed_ratio = 1.0 - remaining_ratio
     safe_threshold = clamp(perfect_threshold_ratio, 0.10, 1.00)
-    bar_len = 20
-    filled = int(bar_len * remaining_ratio)
-    bar = ("=" * filled) + ("." * (bar_len - filled))
+    bar = _HUD_TIME_BARS[int(_HUD_BAR_LEN * remaining_ratio)]
     bar_color = _resolve_hud_gradient_color(elapsed_ratio, safe_threshold)
 
     is_perfect = perfect_catch_enabled and elapsed_ratio <= safe_threshold
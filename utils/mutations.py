@@ -1,6 +1,9 @@
 import json
 import random
+import sys
+from bisect import bisect_right
 from dataclasses import dataclass
+from itertools import accumulate
 from pathlib import Path
 from typing import Dict, List, Optional, Sequence, Tuple
 
@@ -72,6 +75,8 @@ def _load_mutations_from_directory(base_dir: Path) -> List[Mutation]:
         name = data.get("name")
         if not name:
             continue
+        if isinstance(name, str):
+            name = sys.intern(name)
 
         chance = _normalize_chance(data.get("chance"), data.get("chance_percent"))
         required_rods = _parse_required_rods(data.get("required_rods"))
@@ -182,5 +187,8 @@ def choose_mutation(mutations: List[Mutation]) -> Optional[Mutation]:
     if roll > total_chance:
         return None
 
-    weights = [mutation.chance for mutation in available]
-    return random.choices(available, weights=weights, k=1)[0]
+    # Sorteio único: soma acumulada + bisect, como o random.choices faz
+    # internamente, sem montar a lista de resultado.
+    cumulative = list(accumulate(mutation.chance for mutation in available))
+    pick = random.random() * cumulative[-1]
+    return available[bisect_right(cumulative, pick, 0, len(cumulative) - 1)]
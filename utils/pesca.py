@@ -1,4 +1,5 @@
-﻿import importlib
+﻿import heapq
+import importlib
 import importlib.util
 import json
 import math
@@ -9,12 +10,14 @@ import signal
 import sys
 import threading
 import time
-from collections import deque
+from collections import defaultdict, deque
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Callable, Dict, List, Optional
+from typing import Callable, DefaultDict, Deque, Dict, List, Optional, Sequence, Tuple
 
-from pynput import keyboard
 from rich.text import Text
 
 from utils.baits import BaitDefinition, build_bait_lookup, load_bait_crates
@@ -42,6 +45,7 @@ from utils.cosmetics import (
 )
 from utils.dialogue import get_menu_line
 from utils.inventory import InventoryEntry, format_inventory_entry, render_inventory
+from utils.json_io import loads_json_bytes, read_files_parallel
 from utils.shiny import ShinyConfig, load_shiny_config, roll_shiny_on_catch
 from utils.levels import RARITY_XP, apply_xp_gain, xp_for_rarity, xp_required_for_level
 from utils.menu_input import read_menu_choice
@@ -52,8 +56,7 @@ from utils.market import (
 from utils.crafting import (
     CraftingProgress,
     CraftingState,
-    count_inventory_fish,
-    count_inventory_mutations,
+    count_inventory_fish_and_mutations,
     load_crafting_definitions,
     restore_crafting_progress,
     restore_crafting_state,
@@ -96,7 +99,11 @@ from utils.mutations import (
 from utils.events import ActiveEvent, EventDefinition, EventManager
 from utils.hunts import ActiveHunt, HuntDefinition, HuntManager
 from utils.weather import WeatherDefinition, WeatherManager, load_weather
-from utils.pesca_autosave import autosave_state as _autosave_state_impl
+from utils.pesca_autosave import (
+    autosave_pending,
+    autosave_state as _autosave_state_impl,
+    flush_autosave,
+)
 from utils.pesca_boot import (
     build_default_unlocked_pools,
     build_default_unlocked_rods,
@@ -122,6 +129,7 @@ from utils.perfect_catch import (
     parse_perfect_catch_config,
 )
 from utils.rod_presentation import format_rod_abilities
+from utils.requirements_common import safe_float, safe_int
 from utils.rods import Rod, load_rods
 from utils.rod_upgrades import (
     RodUpgradeState,
@@ -131,6 +139,7 @@ from utils.rod_upgrades import (
 )
 from utils.save_system import (
     get_default_save_path,
+    index_pools_by_name,
     load_game,
     restore_balance,
     restore_bait_inventory,
@@ -164,7 +173,14 @@ FRENZY_MIN_TIME_S = 0.1
 FRENZY_TWO_KEY_TIME_FACTOR_CAP = 0.45
 FRENZY_ONE_KEY_TIME_FACTOR_CAP = 0.30
 VFX_FLASH_DURATION_S = 0.16
+FISHING_FRAME_INTERVAL_S = 0.016
+AUTOSAVE_EXIT_TIMEOUT_S = 10.0
+TIME_BAR_LEN = 20
+# Só existem TIME_BAR_LEN + 1 barras possíveis; monta todas uma vez.
+_TIME_BARS = tuple("▮" * filled + " " * (TIME_BAR_LEN - filled) for filled in range(TIME_BAR_LEN + 1))
 _ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+# Sem terminal o rich descarta as cores; nem vale montar o markup.
+_STDOUT_IS_TTY = sys.stdout is not None and sys.stdout.isatty()
 
 
 def flush_input_buffer() -> None:
@@ -181,6 +197,21 @@ def flush_input_buffer() -> None:
             termios.tcflush(sys.stdin.fileno(), termios.TCIFLUSH)
 
 
+def _set_windows_timer_resolution(high_resolution: bool) -> None:
+    # O timer padrao do Windows tem ~15.6 ms: sem isso a espera de 16 ms do
+    # frame vira 31 ms. timeBeginPeriod/timeEndPeriod precisam andar em pares.
+    if os.name != "nt":
+        return
+    try:
+        winmm = importlib.import_module("ctypes").windll.winmm
+        if high_resolution:
+            winmm.timeBeginPeriod(1)
+        else:
+            winmm.timeEndPeriod(1)
+    except (AttributeError, OSError):
+        return
+
+
 def _reel_time_multiplier_from_pace(recent_catch_count: int) -> float:
     if recent_catch_count < PACE_TRIGGER_CATCHES:
         return 1.0
@@ -287,19 +318,24 @@ def _render_colored_segment(
         return f"{prefix}{content}{suffix}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FishingAttempt:
     """Descreve uma tentativa de pesca (o 'quick time event')."""
     sequence: List[str]
     time_limit_s: float  # tempo TOTAL para completar a sequência
     allowed_keys: List[str]
+    allowed_keys_set: frozenset = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        # handle_key filtra toda tecla recebida; set evita a busca linear na lista.
+        object.__setattr__(self, "allowed_keys_set", frozenset(self.allowed_keys))
 
-@dataclass
+
+@dataclass(slots=True)
 class FishingResult:
     success: bool
     reason: str
-    typed: List[str]
+    typed: List[str]  # mesma lista do minigame, que já terminou; não copia
     elapsed_s: float
 
 
@@ -309,6 +345,23 @@ class FishProfile:
     Perfil de peixe: define como gerar a tentativa (sequência + tempo).
     Isso deixa a lógica expansível: cada peixe pode ter seu comportamento.
     """
+    __slots__ = (
+        "name",
+        "rarity",
+        "description",
+        "kg_min",
+        "kg_max",
+        "base_value",
+        "sequence_len",
+        "reaction_time_s",
+        "sequence_len_range",
+        "allowed_keys",
+        "counts_for_bestiary_completion",
+        "perfect_catch",
+        "unsellable",
+        "_custom_generator",
+    )
+
     def __init__(
         self,
         name: str,
@@ -348,10 +401,10 @@ class FishProfile:
             return self._custom_generator()
 
         if self.sequence_len:
-            seq = [random.choice(self.allowed_keys) for _ in range(self.sequence_len)]
+            length = self.sequence_len
         else:
             length = random.randint(*self.sequence_len_range)
-            seq = [random.choice(self.allowed_keys) for _ in range(length)]
+        seq = random.choices(self.allowed_keys, k=length)
         return FishingAttempt(
             sequence=seq,
             time_limit_s=self.reaction_time_s,
@@ -373,35 +426,206 @@ class FishingPool:
     counts_for_bestiary_completion: bool = True
     secret_entry_code: str = ""
     perfect_catch: PerfectCatchConfig = field(default_factory=PerfectCatchConfig)
+    _alias_cache: Dict[tuple, "_RarityAliasTable"] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _fish_ids: Tuple[int, ...] = field(default=(), init=False, repr=False, compare=False)
+    _fish_tuple: Tuple[FishProfile, ...] = field(default=(), init=False, repr=False, compare=False)
+    _fish_by_rarity: Dict[str, Tuple[FishProfile, ...]] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _combined_weights_cache: Dict[tuple, Dict[str, float]] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _eligible_cache: Dict[float, Tuple[FishProfile, ...]] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        # Indice fixo da pool: evita reagrupar por raridade quando nenhum
+        # peixe de evento/hunt entra na lista elegivel.
+        self._fish_tuple = tuple(self.fish_profiles)
+        self._fish_ids = tuple(map(id, self._fish_tuple))
+        self._fish_by_rarity = _group_fish_by_rarity(self.fish_profiles)
+
+    def eligible_for(self, kg_max: float) -> Tuple[FishProfile, ...]:
+        """Peixes da pool que o kg_max alcança (tupla cacheada)."""
+        eligible = self._eligible_cache.get(kg_max)
+        if eligible is None:
+            eligible = tuple(fish for fish in self._fish_tuple if fish.kg_min <= kg_max)
+            if len(eligible) == len(self._fish_tuple):
+                # Nada filtrado: a propria tupla da pool, que o choose_fish reconhece.
+                eligible = self._fish_tuple
+            if len(self._eligible_cache) >= _ALIAS_CACHE_MAX_ENTRIES:
+                self._eligible_cache.clear()
+            self._eligible_cache[kg_max] = eligible
+        return eligible
+
+    def combined_rarity_weights(
+        self,
+        available_rarities: frozenset,
+        *extra_weights: Dict[str, float],
+    ) -> Dict[str, float]:
+        """Pesos da pool somados aos de evento/hunt, cacheados por combinação."""
+        # As definicoes de evento/hunt vivem a sessao toda; a identidade dos
+        # dicts basta para distinguir as combinacoes.
+        cache_key = (available_rarities, tuple(map(id, extra_weights)))
+        combined = self._combined_weights_cache.get(cache_key)
+        if combined is not None:
+            return combined
+
+        rarities = sorted(available_rarities)
+        combined = normalize_rarity_weights(self.rarity_weights, rarities)
+        for weights in extra_weights:
+            combined = combine_rarity_weights_raw(combined, weights, rarities)
+        if len(self._combined_weights_cache) >= _ALIAS_CACHE_MAX_ENTRIES:
+            self._combined_weights_cache.clear()
+        self._combined_weights_cache[cache_key] = combined
+        return combined
 
     def choose_fish(
         self,
-        eligible_fish: List[FishProfile],
+        eligible_fish: Sequence[FishProfile],
         rod_luck: float,
-        rarity_weights_override: Optional[Dict[str, int]] = None,
+        rarity_weights_override: Optional[Dict[str, float]] = None,
     ) -> FishProfile:
-        fish_by_rarity: Dict[str, List[FishProfile]] = {}
-        for fish in eligible_fish:
-            fish_by_rarity.setdefault(fish.rarity, []).append(fish)
-
-        available_rarities = list(fish_by_rarity.keys())
-        if not available_rarities:
-            raise RuntimeError("Pool sem peixes disponíveis.")
-
         base_weights = rarity_weights_override or self.rarity_weights
-        weights_by_rarity = _apply_luck_to_weights(
-            {
-                rarity: base_weights.get(rarity, 0)
-                for rarity in available_rarities
-            },
-            rod_luck,
+        # A lista elegivel e recriada a cada lance; a chave usa a identidade
+        # dos perfis para reaproveitar a tabela enquanto pool/evento/vara nao mudam.
+        if eligible_fish is self._fish_tuple:
+            fish_ids = self._fish_ids
+        else:
+            fish_ids = tuple(map(id, eligible_fish))
+        cache_key = (
+            fish_ids,
+            round(float(rod_luck), 3),
+            tuple(base_weights.items()),
         )
-        weights = [weights_by_rarity.get(rarity, 0) for rarity in available_rarities]
-        if sum(weights) <= 0:
-            weights = [1 for _ in available_rarities]
+        table = self._alias_cache.get(cache_key)
+        if table is None:
+            if fish_ids == self._fish_ids:
+                fish_by_rarity = self._fish_by_rarity
+            else:
+                fish_by_rarity = _group_fish_by_rarity(eligible_fish)
+            table = _build_rarity_alias_table(fish_by_rarity, rod_luck, base_weights)
+            if len(self._alias_cache) >= _ALIAS_CACHE_MAX_ENTRIES:
+                self._alias_cache.clear()
+            self._alias_cache[cache_key] = table
+        return table.sample()
+
+
+_ALIAS_CACHE_MAX_ENTRIES = 64
+
 
-        selected_rarity = random.choices(available_rarities, weights=weights, k=1)[0]
-        return random.choice(fish_by_rarity[selected_rarity])
+class _RarityAliasTable:
+    """Tabela de alias (Walker) para sortear raridades em O(1)."""
+
+    __slots__ = ("fish_by_rarity", "prob", "alias")
+
+    def __init__(
+        self,
+        fish_by_rarity: List[Sequence[FishProfile]],
+        prob: List[float],
+        alias: List[int],
+    ):
+        self.fish_by_rarity = fish_by_rarity
+        self.prob = prob
+        self.alias = alias
+
+    def sample(self) -> FishProfile:
+        if len(self.prob) == 1:
+            return random.choice(self.fish_by_rarity[0])
+        index = random.randrange(len(self.prob))
+        if random.random() >= self.prob[index]:
+            index = self.alias[index]
+        return random.choice(self.fish_by_rarity[index])
+
+
+def _build_alias_table(weights: List[float]) -> tuple[List[float], List[int]]:
+    count = len(weights)
+    total = float(sum(weights))
+    scaled = [float(weight) * count / total for weight in weights]
+    prob = [1.0] * count
+    alias = list(range(count))
+    small = [index for index, value in enumerate(scaled) if value < 1.0]
+    large = [index for index, value in enumerate(scaled) if value >= 1.0]
+    while small and large:
+        small_index = small.pop()
+        large_index = large.pop()
+        prob[small_index] = scaled[small_index]
+        alias[small_index] = large_index
+        scaled[large_index] += scaled[small_index] - 1.0
+        if scaled[large_index] < 1.0:
+            small.append(large_index)
+        else:
+            large.append(large_index)
+    return prob, alias
+
+
+def _group_fish_by_rarity(
+    fish_profiles: Sequence[FishProfile],
+) -> Dict[str, Tuple[FishProfile, ...]]:
+    grouped: Dict[str, List[FishProfile]] = {}
+    for fish in fish_profiles:
+        grouped.setdefault(fish.rarity, []).append(fish)
+    return {rarity: tuple(fish_list) for rarity, fish_list in grouped.items()}
+
+
+def _build_rarity_alias_table(
+    fish_by_rarity: Dict[str, Tuple[FishProfile, ...]],
+    rod_luck: float,
+    base_weights: Dict[str, float],
+) -> _RarityAliasTable:
+    available_rarities = list(fish_by_rarity.keys())
+    if not available_rarities:
+        raise RuntimeError("Pool sem peixes disponíveis.")
+    if len(available_rarities) == 1:
+        # Uma raridade só (ex.: vara inicial): pesos e sorte não mudam nada.
+        return _RarityAliasTable([fish_by_rarity[available_rarities[0]]], [1.0], [0])
+
+    weights_by_rarity = _apply_luck_to_weights(
+        {
+            rarity: base_weights.get(rarity, 0)
+            for rarity in available_rarities
+        },
+        rod_luck,
+    )
+    weights = [weights_by_rarity.get(rarity, 0) for rarity in available_rarities]
+    if sum(weights) <= 0:
+        weights = [1 for _ in available_rarities]
+
+    prob, alias = _build_alias_table(weights)
+    return _RarityAliasTable(
+        [fish_by_rarity[rarity] for rarity in available_rarities],
+        prob,
+        alias,
+    )
+
+
+def _build_rarity_rank(xp_by_rarity: Dict[str, int]) -> Tuple[Dict[str, int], int]:
+    # Rank denso pelo valor de XP: XP igual => mesmo rank, e o desempate fica
+    # com a ordem dos pesos, como no antigo sort por RARITY_XP.get(rarity, 0).
+    xp_levels = sorted(set(xp_by_rarity.values()) | {0})
+    level_rank = {xp: index for index, xp in enumerate(xp_levels)}
+    ranks = {rarity: level_rank[xp] for rarity, xp in xp_by_rarity.items()}
+    return ranks, level_rank[0]
+
+
+# Ordem global das raridades por XP (0 = mais comum); fora de RARITY_XP conta
+# como XP 0.
+_RARITY_RANK, _UNKNOWN_RARITY_RANK = _build_rarity_rank(RARITY_XP)
 
 
 def _apply_luck_to_weights(
@@ -410,21 +634,31 @@ def _apply_luck_to_weights(
 ) -> Dict[str, float]:
     if not weights:
         return {}
+    return dict(_apply_luck_cached(tuple(weights.items()), float(rod_luck)))
+
 
-    luck = float(rod_luck)
+@lru_cache(maxsize=256)
+def _apply_luck_cached(
+    weights_items: Tuple[Tuple[str, float], ...],
+    luck: float,
+) -> Tuple[Tuple[str, float], ...]:
+    weights = dict(weights_items)
     if luck == 0:
-        return weights
+        return weights_items
 
     rarities = list(weights.keys())
-    ordered = sorted(
-        rarities,
-        key=lambda rarity: RARITY_XP.get(rarity, 0),
-    )
-    max_rank = max(0, len(ordered) - 1)
+    max_rank = max(0, len(rarities) - 1)
     if max_rank == 0:
-        return weights
+        return weights_items
 
-    ranks = {rarity: index for index, rarity in enumerate(ordered)}
+    # A sorte escala pela posicao dentro das raridades presentes, entao o
+    # rank global so serve de chave de ordenacao.
+    rank_of = _RARITY_RANK.get
+    ordered = sorted(
+        enumerate(rarities),
+        key=lambda item: (rank_of(item[1], _UNKNOWN_RARITY_RANK), item[0]),
+    )
+    ranks = {rarity: index for index, (_, rarity) in enumerate(ordered)}
     total = sum(float(value) for value in weights.values())
     adjusted: Dict[str, float] = {}
     for rarity in rarities:
@@ -440,20 +674,21 @@ def _apply_luck_to_weights(
 
     adjusted_total = sum(adjusted.values())
     if adjusted_total <= 0:
-        return weights
+        return weights_items
 
     scale = total / adjusted_total if total > 0 else 1.0
-    return {rarity: value * scale for rarity, value in adjusted.items()}
+    return tuple((rarity, value * scale) for rarity, value in adjusted.items())
 
 
 def normalize_rarity_weights(
     configured_weights: Dict[str, float],
     available_rarities: List[str],
 ) -> Dict[str, int]:
+    available_set = set(available_rarities)
     filtered = {
         rarity: float(weight)
         for rarity, weight in configured_weights.items()
-        if rarity in available_rarities and weight > 0
+        if rarity in available_set and weight > 0
     }
 
     if not filtered:
@@ -467,31 +702,54 @@ def normalize_rarity_weights(
         return weights
 
     total = sum(filtered.values())
-    scaled = {rarity: (weight / total) * 100 for rarity, weight in filtered.items()}
-    floors = {rarity: math.floor(value) for rarity, value in scaled.items()}
+    if total == 100 and all(weight.is_integer() for weight in filtered.values()):
+        # Caso comum: a config ja vem em porcentagens inteiras somando 100.
+        return {rarity: int(weight) for rarity, weight in filtered.items()}
+    floors: Dict[str, int] = {}
+    fractions: List[Tuple[str, float]] = []
+    for rarity, weight in filtered.items():
+        scaled = (weight / total) * 100
+        floor_value = math.floor(scaled)
+        floors[rarity] = floor_value
+        fractions.append((rarity, scaled - floor_value))
     remainder = 100 - sum(floors.values())
 
-    fractions = sorted(
-        ((rarity, scaled[rarity] - floors[rarity]) for rarity in floors),
-        key=lambda item: item[1],
-        reverse=True,
-    )
-    for rarity, _ in fractions[:remainder]:
+    # nlargest mantem a ordem estavel do sorted(reverse=True) nos empates.
+    for rarity, _ in heapq.nlargest(remainder, fractions, key=itemgetter(1)):
         floors[rarity] += 1
 
     return floors
 
 
-def combine_rarity_weights(
+def combine_rarity_weights_raw(
     base_weights: Dict[str, float],
     extra_weights: Dict[str, float],
     available_rarities: List[str],
-) -> Dict[str, int]:
+) -> Dict[str, float]:
+    """Soma os pesos sem arredondar para inteiros (o sorteio so usa proporcoes)."""
     combined = {
-        rarity: float(base_weights.get(rarity, 0)) + float(extra_weights.get(rarity, 0))
+        rarity: max(
+            0.0,
+            float(base_weights.get(rarity, 0)) + float(extra_weights.get(rarity, 0)),
+        )
         for rarity in available_rarities
     }
-    return normalize_rarity_weights(combined, available_rarities)
+    total = sum(combined.values())
+    if total <= 0:
+        return combined
+    # Mantem a soma em 100 para que um segundo merge (hunt) pese igual a antes.
+    scale = 100 / total
+    return {rarity: weight * scale for rarity, weight in combined.items()}
+
+
+def _intern_rarity(rarity):
+    # Raridades viram chave de dict a cada lance (pesos, agrupamento, RARITY_XP);
+    # strings internadas comparam por identidade.
+    return sys.intern(rarity) if isinstance(rarity, str) else rarity
+
+
+def _intern_rarity_keys(weights: Dict) -> Dict:
+    return {_intern_rarity(rarity): weight for rarity, weight in weights.items()}
 
 
 def load_fish_profiles_from_dir(
@@ -501,11 +759,14 @@ def load_fish_profiles_from_dir(
     if not fish_dir.exists():
         return []
 
+    fish_paths = sorted(fish_dir.glob("*.json"))
+    perfect_catch_fallback = pool_perfect_catch or PerfectCatchConfig()
     fish_profiles: List[FishProfile] = []
-    for fish_path in sorted(fish_dir.glob("*.json")):
+    for fish_path, raw_data in zip(fish_paths, read_files_parallel(fish_paths)):
         try:
-            with fish_path.open("r", encoding="utf-8") as handle:
-                fish_data = json.load(handle)
+            if isinstance(raw_data, OSError):
+                raise raw_data
+            fish_data = loads_json_bytes(raw_data)
         except (OSError, json.JSONDecodeError) as exc:
             print(f"Aviso: peixe ignorado ({fish_path}): {exc}")
             continue
@@ -516,17 +777,24 @@ def load_fish_profiles_from_dir(
         name = fish_data.get("name")
         if not name:
             continue
+        if isinstance(name, str):
+            # Nomes internados aceleram os lookups em fish_by_name/discovered_fish.
+            name = sys.intern(name)
 
         sequence_len = fish_data.get("sequence_len")
         if sequence_len is not None:
             sequence_len = int(sequence_len)
 
-        fish_perfect_catch = parse_perfect_catch_config(
-            fish_data.get("perfect_catch"),
-            source_label=str(fish_path),
-            fallback=pool_perfect_catch or PerfectCatchConfig(),
-            allow_missing=True,
-        )
+        # A maioria dos peixes herda o perfect_catch da pool; so valida quando ha override.
+        raw_perfect_catch = fish_data.get("perfect_catch")
+        fish_perfect_catch = None
+        if raw_perfect_catch is not None:
+            fish_perfect_catch = parse_perfect_catch_config(
+                raw_perfect_catch,
+                source_label=str(fish_path),
+                fallback=perfect_catch_fallback,
+                allow_missing=True,
+            )
         unsellable = False
         if "unsellable" in fish_data:
             parsed_unsellable = _try_parse_bool(fish_data.get("unsellable"))
@@ -540,7 +808,7 @@ def load_fish_profiles_from_dir(
         fish_profiles.append(
             FishProfile(
                 name=name,
-                rarity=fish_data.get("rarity", "Desconhecida"),
+                rarity=_intern_rarity(fish_data.get("rarity", "Desconhecida")),
                 description=fish_data.get("description", ""),
                 kg_min=float(fish_data.get("kg_min", 0.0)),
                 kg_max=float(fish_data.get("kg_max", 0.0)),
@@ -592,6 +860,7 @@ def load_events(base_dir: Path) -> List[EventDefinition]:
         rarity_weights = data.get("rarity_chances", {})
         if not isinstance(rarity_weights, dict):
             rarity_weights = {}
+        rarity_weights = _intern_rarity_keys(rarity_weights)
 
         fish_profiles = load_fish_profiles_from_dir(event_dir / "fish")
         mutations = load_mutations_optional(event_dir / "mutations")
@@ -668,6 +937,7 @@ def load_hunts(
         rarity_weights = data.get("rarity_chances", {})
         if not isinstance(rarity_weights, dict):
             rarity_weights = {}
+        rarity_weights = _intern_rarity_keys(rarity_weights)
 
         fish_profiles = load_fish_profiles_from_dir(hunt_dir / "fish")
         if not fish_profiles:
@@ -698,14 +968,18 @@ def load_pools(base_dir: Path) -> List[FishingPool]:
         raise FileNotFoundError(f"Diretório de pools não encontrado: {base_dir}")
 
     pools: List[FishingPool] = []
-    for pool_dir in sorted(p for p in base_dir.iterdir() if p.is_dir()):
-        config_path = pool_dir / "pool.json"
-        if not config_path.exists():
-            continue
-
+    pool_dirs = [
+        pool_dir
+        for pool_dir in sorted(p for p in base_dir.iterdir() if p.is_dir())
+        if (pool_dir / "pool.json").exists()
+    ]
+    config_paths = [pool_dir / "pool.json" for pool_dir in pool_dirs]
+    raw_configs = read_files_parallel(config_paths)
+    for pool_dir, config_path, raw_config in zip(pool_dirs, config_paths, raw_configs):
         try:
-            with config_path.open("r", encoding="utf-8") as handle:
-                data = json.load(handle)
+            if isinstance(raw_config, OSError):
+                raise raw_config
+            data = loads_json_bytes(raw_config)
         except (OSError, json.JSONDecodeError) as exc:
             print(f"Aviso: pool ignorada ({config_path}): {exc}")
             continue
@@ -731,6 +1005,7 @@ def load_pools(base_dir: Path) -> List[FishingPool]:
         configured_weights = data.get("rarity_chances", {})
         if not isinstance(configured_weights, dict):
             configured_weights = {}
+        configured_weights = _intern_rarity_keys(configured_weights)
         rarity_weights = normalize_rarity_weights(configured_weights, available_rarities)
         raw_counts_flag = data.get("counts_for_bestiary_completion")
         if isinstance(raw_counts_flag, bool):
@@ -758,6 +1033,7 @@ def load_pools(base_dir: Path) -> List[FishingPool]:
                 pool_name = pool_dir.name
         else:
             pool_name = pool_dir.name
+        pool_name = sys.intern(pool_name)
 
         pools.append(
             FishingPool(
@@ -854,6 +1130,10 @@ def select_pool(
     if not visible_entries and not secret_pools_by_code:
         raise RuntimeError("Nenhuma pool desbloqueada.")
 
+    if not use_modern_ui():
+        # O modo moderno ja limpa a tela a cada redesenho do loop abaixo.
+        clear_screen()
+
     while True:
         if use_modern_ui():
             clear_screen()
@@ -1051,18 +1331,51 @@ def select_pool(
 # Engine de Input (sem Enter)
 # -----------------------------
 
+def _next_frame_deadline(previous_deadline: float, now: float) -> float:
+    """Próximo frame ancorado no anterior, para o HUD não acumular atraso."""
+    if now < previous_deadline:
+        # Acordou por tecla antes do frame: o prazo do frame continua o mesmo.
+        return previous_deadline
+    deadline = previous_deadline + FISHING_FRAME_INTERVAL_S
+    if deadline <= now:
+        # Frame atrasou (render lento, tecla): reancora em vez de tentar compensar.
+        return now + FISHING_FRAME_INTERVAL_S
+    return deadline
+
+
 class KeyStream:
     """
     Captura teclas em tempo real e fornece os eventos para o jogo.
     Implementado com pynput (cross-platform).
     """
-    def __init__(self):
-        self._lock = threading.Lock()
-        self._buffer: List[str] = []
+    def __init__(self, accepted_keys: Optional[frozenset] = None):
+        # deque.append/popleft sao atomicos sob o GIL; o Event so acorda o consumidor.
+        self._buffer: Deque[str] = deque()
+        self._accepted_keys = accepted_keys
+        self._key_ready = threading.Event()
         self._stop = False
-        self._listener: Optional[keyboard.Listener] = None
+        self._listener = None
+        self._high_resolution_timer = False
 
     def start(self):
+        # pynput carrega backends nativos (X11/Quartz/win32) no import; so
+        # e necessario quando a primeira pescaria comeca, nao na abertura do jogo.
+        try:
+            keyboard = importlib.import_module("pynput.keyboard")
+        except ImportError as exc:
+            # Sem captura de teclas a pescaria nao roda; encerra a rodada
+            # como um ESC em vez de derrubar o jogo no meio da sessao.
+            print(
+                f"Aviso: captura de teclado indisponivel (pynput): {exc}\n"
+                f"Instale/repare com: {sys.executable} -m pip install pynput"
+            )
+            self._stop = True
+            self._key_ready.set()
+            return
+        if not self._high_resolution_timer:
+            _set_windows_timer_resolution(True)
+            self._high_resolution_timer = True
+
         def on_press(key):
             # Tenta capturar letras; ignora o resto
             try:
@@ -1072,12 +1385,14 @@ class KeyStream:
 
             if ch:
                 ch = ch.lower()
-                with self._lock:
-                    self._buffer.append(ch)
+                accepted_keys = self._accepted_keys
+                if accepted_keys is None or ch in accepted_keys:
+                    self._push(ch)
 
             # ESC encerra o jogo
             if key == keyboard.Key.esc:
                 self._stop = True
+                self._key_ready.set()  # acorda o loop do frame na hora
                 return False  # para o listener
 
         self._listener = keyboard.Listener(on_press=on_press)
@@ -1087,16 +1402,41 @@ class KeyStream:
         if self._listener:
             self._listener.stop()
             self._listener = None
+        if self._high_resolution_timer:
+            _set_windows_timer_resolution(False)
+            self._high_resolution_timer = False
 
     def stop_requested(self) -> bool:
         return self._stop
 
+    def accept_only(self, keys: frozenset) -> None:
+        """Descarta na captura as teclas fora de `keys` (ex.: allowed_keys da tentativa)."""
+        self._accepted_keys = keys
+
+    def _push(self, ch: str) -> None:
+        self._buffer.append(ch)
+        self._key_ready.set()
+
     def pop_all(self) -> List[str]:
-        with self._lock:
-            items = self._buffer[:]
-            self._buffer.clear()
+        # Limpa o sinal antes de drenar: uma tecla que chegue no meio
+        # deixa o Event armado para o próximo wait_keys. is_set() não pega
+        # lock, então um frame sem teclas não toca no Condition do Event.
+        if self._key_ready.is_set():
+            self._key_ready.clear()
+        buffer = self._buffer
+        if not buffer:
+            return []
+        items: List[str] = []
+        while buffer:
+            items.append(buffer.popleft())
         return items
 
+    def wait_keys(self, timeout_s: float) -> List[str]:
+        """Bloqueia até chegar uma tecla (ou estourar o timeout) e devolve as pendentes."""
+        if not self._buffer:
+            self._key_ready.wait(max(0.0, timeout_s))
+        return self.pop_all()
+
 
 # -----------------------------
 # Lógica da Pesca (flexível)
@@ -1147,6 +1487,8 @@ class FishingMiniGame:
         self.can_greed = can_greed
         self.greed_chance = max(0.0, min(1.0, float(greed_chance)))
         self.bonus_time_s = 0.0
+        # Prazo absoluto (start_time + limite + bonus); atualizado junto com o bonus.
+        self._deadline = attempt.time_limit_s
         self.slam_activations: int = 0
         self.slam_bonus_accum_s: float = 0.0
         self.curse_activations: int = 0
@@ -1165,6 +1507,9 @@ class FishingMiniGame:
         self.active_vfx_color = ""
         self.active_vfx_source = ""
         self.vfx_active_until = 0.0
+        self._sequence_upper = [key.upper() for key in attempt.sequence]
+        self._remaining_text_key: Optional[tuple] = None
+        self._remaining_text = ""
 
     def expected_key(self) -> Optional[str]:
         if self.index >= len(self.attempt.sequence):
@@ -1177,12 +1522,29 @@ class FishingMiniGame:
     def total_time_limit(self) -> float:
         return self.attempt.time_limit_s + self.bonus_time_s
 
-    def time_left(self) -> float:
-        elapsed = time.perf_counter() - self.start_time
-        return max(0.0, self.total_time_limit() - elapsed)
+    def time_left(self, now: Optional[float] = None) -> float:
+        if now is None:
+            now = time.perf_counter()
+        return max(0.0, self._deadline - now)
 
     def begin(self) -> None:
         self.start_time = time.perf_counter()
+        self._deadline = self.start_time + self.total_time_limit()
+
+    def _add_bonus_time(self, delta_s: float) -> None:
+        self.bonus_time_s += delta_s
+        self._deadline += delta_s
+
+    def remaining_sequence_text(self) -> str:
+        """Teclas restantes em maiusculas; so recalcula quando o progresso muda."""
+        # Slash remove teclas da sequencia, entao o tamanho entra na chave.
+        cache_key = (len(self.typed), len(self.attempt.sequence))
+        if cache_key != self._remaining_text_key:
+            if len(self._sequence_upper) != cache_key[1]:
+                self._sequence_upper = [key.upper() for key in self.attempt.sequence]
+            self._remaining_text = " ".join(self._sequence_upper[cache_key[0]:])
+            self._remaining_text_key = cache_key
+        return self._remaining_text
 
     def get_ability_counter_text(self) -> str:
         if self.last_ability_label == "Greed!" and self.greed_activated:
@@ -1230,28 +1592,33 @@ class FishingMiniGame:
             self.vfx_ability_progress = 0
             self._trigger_vfx(color=self.vfx_ability_color, source="ability")
 
-    def get_active_vfx_color(self) -> str:
+    def get_active_vfx_color(self, now: Optional[float] = None) -> str:
         if not self.active_vfx_color:
             return ""
-        if time.perf_counter() > self.vfx_active_until:
+        if now is None:
+            now = time.perf_counter()
+        if now > self.vfx_active_until:
             self.active_vfx_color = ""
             self.active_vfx_source = ""
             return ""
         return self.active_vfx_color
 
-    def handle_key(self, key: str) -> Optional[FishingResult]:
+    def handle_key(self, key: str, now: Optional[float] = None) -> Optional[FishingResult]:
         """
         Processa uma tecla. Retorna FishingResult se terminou (sucesso/erro),
         ou None se ainda está em andamento.
+        `now` permite reaproveitar o perf_counter lido uma vez por frame.
         """
         # só considera teclas permitidas
-        if key not in self.attempt.allowed_keys:
+        if key not in self.attempt.allowed_keys_set:
             return None
 
         # timeout
-        elapsed = time.perf_counter() - self.start_time
-        if elapsed > self.total_time_limit():
-            return FishingResult(False, "Tempo esgotado", self.typed[:], elapsed)
+        if now is None:
+            now = time.perf_counter()
+        elapsed = now - self.start_time
+        if now > self._deadline:
+            return FishingResult(False, "Tempo esgotado", self.typed, elapsed)
 
         min_slash_index = self.index + 2
         if self.can_slash and self.slash_chance > 0 and min_slash_index < len(self.attempt.sequence):
@@ -1263,22 +1630,21 @@ class FishingMiniGame:
                 if self.slash_power > remaining_letters:
                     self.slash_cuts_accum += remaining_letters
                     self.index = len(self.attempt.sequence)
-                    elapsed = time.perf_counter() - self.start_time
-                    return FishingResult(True, "Capturou o peixe!", self.typed[:], elapsed)
+                    return FishingResult(True, "Capturou o peixe!", self.typed, elapsed)
 
                 removable = len(self.attempt.sequence) - min_slash_index
                 cuts = min(self.slash_power, removable)
                 for _ in range(cuts):
                     remove_index = random.randrange(min_slash_index, len(self.attempt.sequence))
                     self.attempt.sequence.pop(remove_index)
+                    self._sequence_upper.pop(remove_index)
                 self.slash_cuts_accum += max(0, cuts)
                 if self.is_done():
-                    elapsed = time.perf_counter() - self.start_time
-                    return FishingResult(True, "Capturou o peixe!", self.typed[:], elapsed)
+                    return FishingResult(True, "Capturou o peixe!", self.typed, elapsed)
 
         if self.can_slam and self.slam_chance > 0 and self.slam_time_bonus > 0:
             if random.random() <= self.slam_chance:
-                self.bonus_time_s += self.slam_time_bonus
+                self._add_bonus_time(self.slam_time_bonus)
                 self.slam_activations += 1
                 self.slam_bonus_accum_s += self.slam_time_bonus
                 self.last_ability_label = "Slam!"
@@ -1286,14 +1652,14 @@ class FishingMiniGame:
 
         if self.can_curse and self.curse_chance > 0 and self.curse_time_penalty > 0:
             if random.random() <= self.curse_chance:
-                self.bonus_time_s -= self.curse_time_penalty
+                self._add_bonus_time(-self.curse_time_penalty)
                 self.curse_activations += 1
                 self.curse_penalty_accum_s += self.curse_time_penalty
                 self.last_ability_label = "Curse!"
                 self._register_ability_activation()
-                elapsed = time.perf_counter() - self.start_time
-                if elapsed > self.total_time_limit():
-                    return FishingResult(False, "Tempo esgotado", self.typed[:], elapsed)
+                # Curse encurta o prazo: confere de novo, no mesmo instante `now`.
+                if now > self._deadline:
+                    return FishingResult(False, "Tempo esgotado", self.typed, elapsed)
 
         expected = self.expected_key()
         if expected is None:
@@ -1314,16 +1680,14 @@ class FishingMiniGame:
                 self.last_ability_label = "Greed!"
                 self._register_ability_activation()
                 # Speed up timer by 30% (reduce remaining time)
-                elapsed_now = time.perf_counter() - self.start_time
-                remaining = self.total_time_limit() - elapsed_now
+                remaining = self.total_time_limit() - elapsed
                 time_reduction = remaining * 0.30
-                self.bonus_time_s -= time_reduction
+                self._add_bonus_time(-time_reduction)
 
         if key == expected:
             self.index += 1
             if self.is_done():
-                elapsed = time.perf_counter() - self.start_time
-                return FishingResult(True, "Capturou o peixe!", self.typed[:], elapsed)
+                return FishingResult(True, "Capturou o peixe!", self.typed, elapsed)
             return None
 
         # errou tecla — Pierce pode salvar
@@ -1334,17 +1698,16 @@ class FishingMiniGame:
                 self._register_ability_activation()
                 self.index += 1
                 if self.is_done():
-                    elapsed = time.perf_counter() - self.start_time
-                    return FishingResult(True, "Capturou o peixe!", self.typed[:], elapsed)
+                    return FishingResult(True, "Capturou o peixe!", self.typed, elapsed)
                 return None
 
-        elapsed = time.perf_counter() - self.start_time
-        return FishingResult(False, f"Errou (esperado '{expected}', veio '{key}')", self.typed[:], elapsed)
+        return FishingResult(False, f"Errou (esperado '{expected}', veio '{key}')", self.typed, elapsed)
 
-    def check_timeout(self) -> Optional[FishingResult]:
-        elapsed = time.perf_counter() - self.start_time
-        if elapsed > self.total_time_limit() and not self.is_done():
-            return FishingResult(False, "Tempo esgotado", self.typed[:], elapsed)
+    def check_timeout(self, now: Optional[float] = None) -> Optional[FishingResult]:
+        if now is None:
+            now = time.perf_counter()
+        if now > self._deadline and not self.is_done():
+            return FishingResult(False, "Tempo esgotado", self.typed, now - self.start_time)
         return None
 
 
@@ -1390,6 +1753,7 @@ def render(
     ability_counter_text: str = "",
     weather_text: str = "",
     sequence_vfx_color: str = "",
+    remaining_text: Optional[str] = None,
 ):
     def _terminal_line_width(default: int = 80) -> int:
         try:
@@ -1408,7 +1772,8 @@ def render(
 
     def _render_two_lines(line1: str, line2: str) -> None:
         # Draw HUD + sequence and keep cursor at first line for next frame redraw.
-        print(f"\r\033[2K{line1}\n\033[2K{line2}\033[1A\r", end="", flush=True)
+        sys.stdout.write(f"\r\033[2K{line1}\n\033[2K{line2}\033[1A\r")
+        sys.stdout.flush()
 
     def _build_sequence_line(prefix: str, sequence_text: str, limit: int) -> str:
         plain_line = _trim_line(f"{prefix}{sequence_text}", limit)
@@ -1423,10 +1788,11 @@ def render(
         )
 
     line_width = _terminal_line_width()
+    if remaining_text is None:
+        remaining_text = " ".join(k.upper() for k in attempt.sequence[len(typed):])
 
     if use_modern_ui():
-        remaining = attempt.sequence[len(typed):]
-        seq_str = " ".join(k.upper() for k in remaining) if remaining else "OK"
+        seq_str = remaining_text or "OK"
         seq_line = _build_sequence_line("Seq: ", seq_str, line_width)
 
         if line_width >= 96:
@@ -1468,19 +1834,13 @@ def render(
         _render_two_lines(line, seq_line)
         return
 
-    seq = attempt.sequence
-    idx = len(typed)
-
     # Mostra apenas as teclas restantes
-    remaining = seq[idx:]
-    seq_str = " ".join(k.upper() for k in remaining) if remaining else "✔"
+    seq_str = remaining_text or "✔"
 
     # Barra de tempo
     total = max(0.001, total_time_s if total_time_s is not None else attempt.time_limit_s)
     ratio = max(0.0, min(1.0, time_left / total))
-    bar_len = 20
-    filled = int(bar_len * ratio)
-    bar = "▮" * filled + " " * (bar_len - filled)
+    bar = _TIME_BARS[int(TIME_BAR_LEN * ratio)]
 
     sequence_prefix = "Seq: "
     sequence_content = f"{seq_str:<15}"
@@ -1499,7 +1859,8 @@ def render(
             line = plain_line
     else:
         line = plain_line
-    print(f"\r\033[2K{line}", end="", flush=True)
+    sys.stdout.write(f"\r\033[2K{line}")
+    sys.stdout.flush()
 
 def show_main_menu(
     selected_pool: FishingPool,
@@ -1510,6 +1871,7 @@ def show_main_menu(
     active_hunt: Optional[ActiveHunt],
     dev_mode: bool = False,
     active_weather: Optional[WeatherDefinition] = None,
+    notice: str = "",
 ) -> str:
     if use_modern_ui():
         clear_screen()
@@ -1563,6 +1925,8 @@ def show_main_menu(
             options=options,
             prompt="Escolha uma opcao:",
         )
+        if notice:
+            print(notice)
         return input("> ").strip()
 
     clear_screen()
@@ -1607,6 +1971,8 @@ def show_main_menu(
     if dev_mode:
         print("7. Dev Tools")
     print("0. Sair")
+    if notice:
+        print(notice)
     return input("Escolha uma opcao: ").strip()
 
 
@@ -2384,6 +2750,7 @@ def autosave_state(
     rod_upgrade_state: RodUpgradeState,
     hunt_manager: Optional[HuntManager],
     discovered_shiny_fish: Optional[set[str]] = None,
+    debounce: bool = False,
 ) -> None:
     _autosave_state_impl(
         save_path,
@@ -2411,6 +2778,7 @@ def autosave_state(
         hunt_manager,
         serialize_bestiary_reward_state,
         discovered_shiny_fish=discovered_shiny_fish,
+        debounce=debounce,
     )
 def format_bait_stats(bait: BaitDefinition) -> str:
     return (
@@ -2867,8 +3235,7 @@ def show_inventory(
                 show_badge=False,
             )
             if inventory:
-                print("")
-                print(f"Peixes [{page + 1}/{total_pages}]")
+                print(f"\nPeixes [{page + 1}/{total_pages}]")
                 render_inventory(
                     inventory[start:end],
                     show_title=False,
@@ -3029,28 +3396,33 @@ def show_inventory(
         owned_baits = list_owned_baits()
         active_bait_label, active_bait_stats = active_bait_summary()
         start, end, total_pages = get_page_bounds()
-        print("=== Inventario ===")
-        print("\nVara equipada:")
-        print(f"- {equipped_rod.name}")
-        print(f"  Stats: {format_rod_stats(equipped_rod, rod_upgrade_state)}")
-        print("\nIsca ativa:")
-        print(f"- {active_bait_label}")
-        if active_bait_stats:
-            print(f"  {active_bait_stats}")
         cosmetics_option_key = "4" if equipped_bait_id else "3"
         storage_option_key = "5" if equipped_bait_id else "4"
-        print("\n1. Equipar vara")
-        print("2. Equipar isca")
+        lines = [
+            "=== Inventario ===",
+            "\nVara equipada:",
+            f"- {equipped_rod.name}",
+            f"  Stats: {format_rod_stats(equipped_rod, rod_upgrade_state)}",
+            "\nIsca ativa:",
+            f"- {active_bait_label}",
+        ]
+        if active_bait_stats:
+            lines.append(f"  {active_bait_stats}")
+        lines.extend(["\n1. Equipar vara", "2. Equipar isca"])
         if equipped_bait_id:
-            print("3. Desequipar isca")
-        print(f"{cosmetics_option_key}. Cosmeticos")
-        print(f"{storage_option_key}. Storage ({len(storage)} guardados)")
+            lines.append("3. Desequipar isca")
+        lines.append(f"{cosmetics_option_key}. Cosmeticos")
+        lines.append(f"{storage_option_key}. Storage ({len(storage)} guardados)")
         if total_pages > 1:
-            print(f"{PAGE_NEXT_KEY.upper()}. Proxima pagina de peixes ({page + 1}/{total_pages})")
-            print(f"{PAGE_PREV_KEY.upper()}. Pagina anterior de peixes ({page + 1}/{total_pages})")
-        print("0. Voltar")
-
-        print("\nPeixes:")
+            lines.append(
+                f"{PAGE_NEXT_KEY.upper()}. Proxima pagina de peixes ({page + 1}/{total_pages})"
+            )
+            lines.append(
+                f"{PAGE_PREV_KEY.upper()}. Pagina anterior de peixes ({page + 1}/{total_pages})"
+            )
+        lines.append("0. Voltar")
+        lines.append("\nPeixes:")
+        print("\n".join(lines))
         render_inventory(
             inventory[start:end],
             show_title=False,
@@ -3265,8 +3637,13 @@ def run_fishing_round(
             else []
         )
         hunt_fish_names = {fish.name for fish in hunt_fish}
-        combined_fish = combine_fish_profiles(selected_pool, event_def, hunt_fish)
-        eligible_fish = filter_eligible_fish(combined_fish, kg_max=effective_kg_max)
+        eligible_fish: Sequence[FishProfile]
+        if event_def and event_def.fish_profiles or hunt_fish:
+            combined_fish = combine_fish_profiles(selected_pool, event_def, hunt_fish)
+            eligible_fish = filter_eligible_fish(combined_fish, kg_max=effective_kg_max)
+        else:
+            # Sem peixe de evento/hunt: tupla cacheada da pool, reconhecida no choose_fish.
+            eligible_fish = selected_pool.eligible_for(effective_kg_max)
         if not eligible_fish:
             ks.stop()
             print("Nenhum peixe desta pool pode ser fisgado com o setup atual.")
@@ -3276,23 +3653,15 @@ def run_fishing_round(
             return level, xp, equipped_bait_id
 
         if event_def or hunt_def:
-            combined_rarities = sorted({fish.rarity for fish in eligible_fish})
-            combined_weights = normalize_rarity_weights(
-                selected_pool.rarity_weights,
-                combined_rarities,
+            extra_weights = [
+                definition.rarity_weights
+                for definition in (event_def, hunt_def)
+                if definition
+            ]
+            combined_weights = selected_pool.combined_rarity_weights(
+                frozenset(fish.rarity for fish in eligible_fish),
+                *extra_weights,
             )
-            if event_def:
-                combined_weights = combine_rarity_weights(
-                    combined_weights,
-                    event_def.rarity_weights,
-                    combined_rarities,
-                )
-            if hunt_def:
-                combined_weights = combine_rarity_weights(
-                    combined_weights,
-                    hunt_def.rarity_weights,
-                    combined_rarities,
-                )
         else:
             combined_weights = selected_pool.rarity_weights
 
@@ -3338,31 +3707,27 @@ def run_fishing_round(
             hard_multiplier = max(-90.0, effective_rod.hardcount) / 100.0
             delta_keys = int(round(len(attempt_sequence) * hard_multiplier))
             if delta_keys > 0:
-                for _ in range(delta_keys):
-                    attempt_sequence.append(random.choice(attempt.allowed_keys))
+                attempt_sequence.extend(random.choices(attempt.allowed_keys, k=delta_keys))
             elif delta_keys < 0:
                 attempt_sequence = attempt_sequence[: max(1, len(attempt_sequence) + delta_keys)]
 
         altered_time_limit_s = attempt.time_limit_s
         if effective_rod.can_alter and effective_rod.timecount != 0:
             altered_time_limit_s *= max(0.1, 1.0 + (effective_rod.timecount / 100.0))
-        attempt = FishingAttempt(
-            sequence=attempt_sequence,
-            time_limit_s=altered_time_limit_s,
-            allowed_keys=attempt.allowed_keys,
-        )
         now_s = time.monotonic()
         prune_recent_catch_times(now_s)
         pace_multiplier = _reel_time_multiplier_from_pace(len(recent_catch_times))
         weather_control_bonus = weather.control_bonus if weather else 0.0
-        base_time_limit_s = max(0.5, attempt.time_limit_s + effective_control + weather_control_bonus)
+        base_time_limit_s = max(0.5, altered_time_limit_s + effective_control + weather_control_bonus)
+        # Uma única FishingAttempt com sequência e tempo finais (alter + controle + pace).
         attempt = FishingAttempt(
-            sequence=attempt.sequence,
+            sequence=attempt_sequence,
             time_limit_s=max(0.5, base_time_limit_s * pace_multiplier),
             allowed_keys=attempt.allowed_keys,
         )
         game = _build_fishing_minigame(attempt, effective_rod)
         game.begin()
+        ks.accept_only(attempt.allowed_keys_set)
 
         consumed_bait_name: Optional[str] = None
         consumed_bait_remaining = 0
@@ -3392,39 +3757,72 @@ def run_fishing_round(
             )
 
         result: Optional[FishingResult] = None
+        pending_keys = ks.pop_all()
+
+        # Invariantes do loop de ~60 FPS amarrados a nomes locais.
+        perf_counter = time.perf_counter
+        stop_requested = ks.stop_requested
+        wait_keys = ks.wait_keys
+        handle_key = game.handle_key
+        check_timeout = game.check_timeout
+        typed = game.typed
+        weather_hud_text = f"{weather.icon} {weather.name}" if weather else ""
+        perfect_threshold_ratio = perfect_catch_cfg.threshold_ratio
+        perfect_catch_enabled = perfect_catch_cfg.enabled
+        next_frame_at = perf_counter()
+        last_frame_key: Optional[tuple] = None
 
         while result is None:
-            if ks.stop_requested():
+            now = perf_counter()
+            if stop_requested():
                 result = FishingResult(
                     False,
                     "Saiu da pesca (ESC)",
-                    game.typed[:],
-                    time.perf_counter() - game.start_time,
+                    typed,
+                    now - game.start_time,
                 )
                 break
 
-            for ch in ks.pop_all():
-                result = game.handle_key(ch)
+            for ch in pending_keys:
+                result = handle_key(ch, now)
                 if result is not None:
                     break
 
             if result is None:
-                result = game.check_timeout()
+                result = check_timeout(now)
 
+            time_left = game.time_left(now)
+            total_time_s = game.total_time_limit()
             ability_counter_text = game.get_ability_counter_text()
-            weather_hud_text = f"{weather.icon} {weather.name}" if weather else ""
-            render(
-                attempt,
-                game.typed,
-                game.time_left(),
-                total_time_s=game.total_time_limit(),
-                perfect_threshold_ratio=perfect_catch_cfg.threshold_ratio,
-                perfect_catch_enabled=perfect_catch_cfg.enabled,
-                ability_counter_text=ability_counter_text,
-                weather_text=weather_hud_text,
-                sequence_vfx_color=game.get_active_vfx_color(),
+            sequence_vfx_color = game.get_active_vfx_color(now)
+            remaining_text = game.remaining_sequence_text()
+            # So escreve no terminal quando algo visivel mudou (HUD mostra centesimos).
+            frame_key = (
+                len(typed),
+                len(attempt.sequence),
+                round(time_left, 2),
+                total_time_s,
+                ability_counter_text,
+                sequence_vfx_color,
+                remaining_text,
             )
-            time.sleep(0.016)
+            if frame_key != last_frame_key:
+                last_frame_key = frame_key
+                render(
+                    attempt,
+                    typed,
+                    time_left,
+                    total_time_s=total_time_s,
+                    perfect_threshold_ratio=perfect_threshold_ratio,
+                    perfect_catch_enabled=perfect_catch_enabled,
+                    ability_counter_text=ability_counter_text,
+                    weather_text=weather_hud_text,
+                    sequence_vfx_color=sequence_vfx_color,
+                    remaining_text=remaining_text,
+                )
+            # Acorda assim que chega tecla; sem tecla, mantém ~60 FPS no HUD.
+            next_frame_at = _next_frame_deadline(next_frame_at, perf_counter())
+            pending_keys = wait_keys(next_frame_at - perf_counter())
 
         if use_modern_ui():
             print("\n")
@@ -3531,35 +3929,56 @@ def run_fishing_round(
             level, xp, level_ups = apply_xp_gain(level, xp, gained_xp)
             fish_name_label = (
                 f"[#F08080]{fish.name}[/#F08080]"
-                if is_hunt_fish
+                if is_hunt_fish and _STDOUT_IS_TTY
                 else fish.name
             )
-            console.print(f"🎣 Você pescou: {fish_name_label} [{fish.rarity}] - {caught_kg:0.2f}kg")
+            # Monta o resumo da captura e imprime tudo de uma vez. Só as linhas
+            # que já usavam markup passam pelo parser; o resto vai como texto puro
+            # (nomes de peixe/mutação podem conter colchetes).
+            catch_lines = [
+                Text.from_markup(
+                    f"🎣 Você pescou: {fish_name_label} [{fish.rarity}] - {caught_kg:0.2f}kg"
+                )
+            ]
             if first_catch:
-                console.print(f"📘 Primeira captura registrada no bestiário: {fish_name_label}!")
+                catch_lines.append(
+                    Text.from_markup(f"📘 Primeira captura registrada no bestiário: {fish_name_label}!")
+                )
             if mutation:
-                print(
-                    "🧬 Mutação: "
-                    f"{mutation.name} (x{mutation_xp_multiplier:0.2f} XP | "
-                    f"x{mutation_gold_multiplier:0.2f} Gold)"
+                catch_lines.append(
+                    Text(
+                        "🧬 Mutação: "
+                        f"{mutation.name} (x{mutation_xp_multiplier:0.2f} XP | "
+                        f"x{mutation_gold_multiplier:0.2f} Gold)"
+                    )
                 )
             if perfect_catch_hit:
-                print(
-                    "🎯 Perfect Catch! "
-                    f"Concluído em {elapsed_s:0.2f}s/{total_time_s:0.2f}s "
-                    f"(XP x{perfect_catch_cfg.xp_multiplier:0.2f})"
+                catch_lines.append(
+                    Text(
+                        "🎯 Perfect Catch! "
+                        f"Concluído em {elapsed_s:0.2f}s/{total_time_s:0.2f}s "
+                        f"(XP x{perfect_catch_cfg.xp_multiplier:0.2f})"
+                    )
                 )
             if dupe_triggered:
-                print("🔁 Efeito de duplicacao ativado: uma copia do peixe foi para o inventario.")
+                catch_lines.append(
+                    Text("🔁 Efeito de duplicacao ativado: uma copia do peixe foi para o inventario.")
+                )
             if game.pierce_activations > 0:
-                print(f"🔱 Pierce ativado {game.pierce_activations}x durante a pesca!")
+                catch_lines.append(Text(f"🔱 Pierce ativado {game.pierce_activations}x durante a pesca!"))
             if greed_triggered:
-                print("💰 Greed ativado: valor do peixe dobrado!")
+                catch_lines.append(Text("💰 Greed ativado: valor do peixe dobrado!"))
             if is_shiny and shiny_config:
-                console.print(f"[{shiny_config.display.color}]{shiny_config.display.catch_message}[/{shiny_config.display.color}]")
-            print(f"✨ Ganhou {gained_xp} XP.")
+                catch_lines.append(
+                    Text.from_markup(
+                        f"[{shiny_config.display.color}]{shiny_config.display.catch_message}[/{shiny_config.display.color}]"
+                    )
+                )
+            catch_lines.append(Text(f"✨ Ganhou {gained_xp} XP."))
             if level_ups:
-                print(f"⬆️  Subiu {level_ups} nível(is)! Agora está no nível {level}.")
+                catch_lines.append(Text(f"⬆️  Subiu {level_ups} nível(is)! Agora está no nível {level}."))
+            # soft_wrap: quebra de linha fica com o terminal, como no print().
+            console.print(Text("\n").join(catch_lines), soft_wrap=True)
 
             # Frenzy: chance to trigger another fishing sequence after a catch
             if (
@@ -3576,10 +3995,7 @@ def run_fishing_round(
                     frenzy_round += 1
                     frenzy_seq_len = max(1, frenzy_seq_len - 1)
                     frenzy_time_factor *= 0.90
-                    frenzy_sequence = [
-                        random.choice(attempt.allowed_keys)
-                        for _ in range(frenzy_seq_len)
-                    ]
+                    frenzy_sequence = random.choices(attempt.allowed_keys, k=frenzy_seq_len)
                     frenzy_time = _calculate_frenzy_time_limit(
                         fish.reaction_time_s
                         + effective_control
@@ -3601,34 +4017,60 @@ def run_fishing_round(
                     print(f"\n🔥 Frenzy #{frenzy_round}! ({frenzy_seq_len} teclas, {frenzy_time:0.1f}s)")
 
                     frenzy_result: Optional[FishingResult] = None
-                    ks2 = KeyStream()
+                    ks2 = KeyStream(accepted_keys=frenzy_attempt.allowed_keys_set)
                     ks2.start()
+                    frenzy_pending_keys: List[str] = []
+                    frenzy_counter_text = f"Frenzy #{frenzy_round}"
+                    frenzy_next_frame_at = perf_counter()
+                    frenzy_last_frame_key: Optional[tuple] = None
                     while frenzy_result is None:
+                        now = perf_counter()
                         if ks2.stop_requested():
                             frenzy_result = FishingResult(
                                 False, "Saiu da pesca (ESC)",
-                                frenzy_game.typed[:],
-                                time.perf_counter() - frenzy_game.start_time,
+                                frenzy_game.typed,
+                                now - frenzy_game.start_time,
                             )
                             break
-                        for ch in ks2.pop_all():
-                            frenzy_result = frenzy_game.handle_key(ch)
+                        for ch in frenzy_pending_keys:
+                            frenzy_result = frenzy_game.handle_key(ch, now)
                             if frenzy_result is not None:
                                 break
                         if frenzy_result is None:
-                            frenzy_result = frenzy_game.check_timeout()
-                        render(
-                            frenzy_attempt,
-                            frenzy_game.typed,
-                            frenzy_game.time_left(),
-                            total_time_s=frenzy_game.total_time_limit(),
-                            perfect_threshold_ratio=perfect_catch_cfg.threshold_ratio,
-                            perfect_catch_enabled=False,
-                            ability_counter_text=f"Frenzy #{frenzy_round}",
-                            weather_text=f"{weather.icon} {weather.name}" if weather else "",
-                            sequence_vfx_color=frenzy_game.get_active_vfx_color(),
+                            frenzy_result = frenzy_game.check_timeout(now)
+                        frenzy_time_left = frenzy_game.time_left(now)
+                        frenzy_total_time_s = frenzy_game.total_time_limit()
+                        frenzy_vfx_color = frenzy_game.get_active_vfx_color(now)
+                        frenzy_remaining_text = frenzy_game.remaining_sequence_text()
+                        frenzy_frame_key = (
+                            len(frenzy_game.typed),
+                            len(frenzy_attempt.sequence),
+                            round(frenzy_time_left, 2),
+                            frenzy_total_time_s,
+                            frenzy_vfx_color,
+                            frenzy_remaining_text,
+                        )
+                        if frenzy_frame_key != frenzy_last_frame_key:
+                            frenzy_last_frame_key = frenzy_frame_key
+                            render(
+                                frenzy_attempt,
+                                frenzy_game.typed,
+                                frenzy_time_left,
+                                total_time_s=frenzy_total_time_s,
+                                perfect_threshold_ratio=perfect_threshold_ratio,
+                                perfect_catch_enabled=False,
+                                ability_counter_text=frenzy_counter_text,
+                                weather_text=weather_hud_text,
+                                sequence_vfx_color=frenzy_vfx_color,
+                                remaining_text=frenzy_remaining_text,
+                            )
+                        frenzy_next_frame_at = _next_frame_deadline(
+                            frenzy_next_frame_at,
+                            perf_counter(),
+                        )
+                        frenzy_pending_keys = ks2.wait_keys(
+                            frenzy_next_frame_at - perf_counter()
                         )
-                        time.sleep(0.016)
 
                     if use_modern_ui():
                         print("\n")
@@ -3752,28 +4194,35 @@ def main(dev_mode: bool = False):
 
     random.seed()
 
-    base_dir = Path(__file__).resolve().parent.parent / "pools"
+    repo_root = Path(__file__).resolve().parent.parent
+    base_dir = repo_root / "pools"
     pools = load_pools(base_dir)
-    events_dir = Path(__file__).resolve().parent.parent / "events"
+    pool_folder_by_name = {pool.name: pool.folder.name for pool in pools}
+    all_pool_names = frozenset(pool_folder_by_name)
+    events_dir = repo_root / "events"
     events = load_events(events_dir)
     event_manager = EventManager(events, dev_tools_enabled=dev_mode)
-    hunts_dir = Path(__file__).resolve().parent.parent / "hunts"
+    hunts_dir = repo_root / "hunts"
     hunts = load_hunts(
         hunts_dir,
-        valid_pool_names={pool.name for pool in pools},
+        valid_pool_names=all_pool_names,
     )
     hunt_manager = HuntManager(hunts, dev_tools_enabled=dev_mode)
-    weather_base_dir = Path(__file__).resolve().parent.parent
-    weather_defs, weather_config = load_weather(weather_base_dir)
+    weather_defs, weather_config = load_weather(repo_root)
     weather_manager = WeatherManager(weather_defs, weather_config, dev_tools_enabled=dev_mode)
-    shiny_config = load_shiny_config(Path(__file__).resolve().parent.parent)
+    shiny_config = load_shiny_config(repo_root)
     event_manager.start()
     weather_manager.start()
-    rods_dir = Path(__file__).resolve().parent.parent / "rods"
+    rods_dir = repo_root / "rods"
     available_rods = load_rods(rods_dir)
-    mutations_dir = Path(__file__).resolve().parent.parent / "mutations"
+    rods_by_name = {rod.name: rod for rod in available_rods}
+    available_rod_names = frozenset(rods_by_name)
+    default_unlocked_rod_names = frozenset(
+        rod.name for rod in available_rods if rod.unlocked_default
+    )
+    mutations_dir = repo_root / "mutations"
     available_mutations = load_mutations(mutations_dir)
-    baits_dir = Path(__file__).resolve().parent.parent / "baits"
+    baits_dir = repo_root / "baits"
     bait_crates = load_bait_crates(baits_dir)
     bait_by_id = build_bait_lookup(bait_crates)
     starter_rod = select_starter_rod(available_rods)
@@ -3782,17 +4231,17 @@ def main(dev_mode: bool = False):
     unlocked_rods = build_default_unlocked_rods(available_rods, starter_rod)
     selected_pool = select_default_pool(pools)
     unlocked_pools = build_default_unlocked_pools(pools, selected_pool)
-    missions_dir = Path(__file__).resolve().parent.parent / "missions"
+    missions_dir = repo_root / "missions"
     missions = load_missions(missions_dir)
     mission_state = restore_mission_state(None, missions)
     mission_progress = MissionProgress()
-    bestiary_rewards_dir = Path(__file__).resolve().parent.parent / "bestiary_rewards"
+    bestiary_rewards_dir = repo_root / "bestiary_rewards"
     bestiary_rewards = load_bestiary_rewards(bestiary_rewards_dir)
     bestiary_reward_state = BestiaryRewardState()
-    crafting_dir = Path(__file__).resolve().parent.parent / "crafting"
+    crafting_dir = repo_root / "crafting"
     crafting_definitions = load_crafting_definitions(
         crafting_dir,
-        valid_rod_names={rod.name for rod in available_rods},
+        valid_rod_names=available_rod_names,
     )
     crafting_state = restore_crafting_state(None, crafting_definitions)
     crafting_progress = CraftingProgress()
@@ -3800,7 +4249,7 @@ def main(dev_mode: bool = False):
     rod_upgrade_state = RodUpgradeState()
     inventory: List[InventoryEntry] = []
     storage: List[InventoryEntry] = []
-    bait_inventory: Dict[str, int] = {}
+    bait_inventory: DefaultDict[str, int] = defaultdict(int)
     equipped_bait_id: Optional[str] = None
     discovered_fish: set[str] = set()
     discovered_shiny_fish: set[str] = set()
@@ -3810,6 +4259,8 @@ def main(dev_mode: bool = False):
     pool_market_orders = {}
 
     save_path = get_default_save_path()
+    # Aviso exibido no proximo desenho do menu, sem travar o loop com sleep.
+    menu_notice = ""
     save_data = load_game(save_path)
     if save_data:
         clear_screen()
@@ -3841,20 +4292,29 @@ def main(dev_mode: bool = False):
         balance = restore_balance(save_data.get("balance"), balance)
         owned_rods = restore_owned_rods(save_data.get("owned_rods"), available_rods, starter_rod)
         unlocked_rods_raw = save_data.get("unlocked_rods")
-        default_unlocked_rods = {rod.name for rod in available_rods if rod.unlocked_default}
         if isinstance(unlocked_rods_raw, list):
-            available_rod_names = {rod.name for rod in available_rods}
             unlocked_rods = {
                 name for name in unlocked_rods_raw if isinstance(name, str) and name in available_rod_names
             }
-            unlocked_rods.update(default_unlocked_rods)
+            unlocked_rods.update(default_unlocked_rod_names)
         else:
-            unlocked_rods = {rod.name for rod in owned_rods} | default_unlocked_rods
-        selected_pool = restore_selected_pool(save_data.get("selected_pool"), pools, selected_pool)
+            unlocked_rods = {rod.name for rod in owned_rods} | default_unlocked_rod_names
+        pools_by_name = index_pools_by_name(pools)
+        selected_pool = restore_selected_pool(
+            save_data.get("selected_pool"),
+            pools,
+            selected_pool,
+            pools_by_name=pools_by_name,
+        )
         unlocked_pools = set(
-            restore_unlocked_pools(save_data.get("unlocked_pools"), pools, selected_pool)
+            restore_unlocked_pools(
+                save_data.get("unlocked_pools"),
+                pools,
+                selected_pool,
+                pools_by_name=pools_by_name,
+            )
         )
-        unlocked_pools.update({pool.name for pool in pools if pool.unlocked_default})
+        unlocked_pools.update(pool.name for pool in pools if pool.unlocked_default)
         equipped_rod = restore_equipped_rod(
             save_data.get("equipped_rod"),
             owned_rods,
@@ -3867,7 +4327,10 @@ def main(dev_mode: bool = False):
         crafting_state = restore_crafting_state(save_data.get("crafting_state"), crafting_definitions)
         crafting_progress = restore_crafting_progress(save_data.get("crafting_progress"))
         pool_market_orders = restore_pool_market_orders(save_data.get("pool_market_orders"))
-        bait_inventory = restore_bait_inventory(save_data.get("bait_inventory"), bait_by_id)
+        bait_inventory = defaultdict(
+            int,
+            restore_bait_inventory(save_data.get("bait_inventory"), bait_by_id),
+        )
         equipped_bait_id = restore_equipped_bait(
             save_data.get("equipped_bait"),
             bait_inventory,
@@ -3880,8 +4343,7 @@ def main(dev_mode: bool = False):
         cosmetics_state = restore_cosmetics_state(save_data.get("cosmetics_state"))
         rod_upgrade_state = restore_rod_upgrade_state(save_data.get("rod_upgrades"))
         hunt_manager.restore_state(restore_hunt_state(save_data.get("hunt_state")))
-        print("Save carregado com sucesso!")
-        time.sleep(1)
+        menu_notice = "Save carregado com sucesso!"
 
     hunt_manager.start()
 
@@ -3901,7 +4363,7 @@ def main(dev_mode: bool = False):
 
     apply_active_cosmetics()
 
-    def autosave_current_state() -> None:
+    def autosave_current_state(debounce: bool = False) -> None:
         autosave_state(
             save_path,
             balance,
@@ -3927,32 +4389,31 @@ def main(dev_mode: bool = False):
             rod_upgrade_state,
             hunt_manager,
             discovered_shiny_fish=discovered_shiny_fish,
+            debounce=debounce,
         )
 
-    fish_by_name: Dict[str, FishProfile] = {
-        fish.name: fish
-        for pool in pools
-        for fish in pool.fish_profiles
-    }
-    event_fish_profiles = [
-        fish
-        for event in events
-        for fish in event.fish_profiles
-    ]
-    event_mutation_profiles = [
-        mutation
-        for event in events
-        for mutation in event.mutations
-    ]
-    hunt_fish_profiles = [
-        fish
-        for hunt in hunts
-        for fish in hunt.fish_profiles
-    ]
-    hunt_fish_names = {fish.name for fish in hunt_fish_profiles}
+    def autosave_after_storage_change() -> None:
+        # Varios movimentos seguidos no storage viram uma gravacao so.
+        autosave_current_state(debounce=True)
+
+    fish_by_name: Dict[str, FishProfile] = {}
+    event_fish_profiles: List[FishProfile] = []
+    event_mutation_profiles: List[Mutation] = []
+    hunt_fish_profiles: List[FishProfile] = []
+    hunt_fish_names: set[str] = set()
+    for pool in pools:
+        for fish in pool.fish_profiles:
+            fish_by_name[fish.name] = fish
+    for event in events:
+        event_fish_profiles.extend(event.fish_profiles)
+        event_mutation_profiles.extend(event.mutations)
+    for hunt in hunts:
+        hunt_fish_profiles.extend(hunt.fish_profiles)
+    # Peixes de pools tem prioridade; eventos e hunts so preenchem nomes livres.
     for fish in event_fish_profiles:
         fish_by_name.setdefault(fish.name, fish)
     for fish in hunt_fish_profiles:
+        hunt_fish_names.add(fish.name)
         fish_by_name.setdefault(fish.name, fish)
 
     bestiary_mutations_by_name: Dict[str, Mutation] = {}
@@ -3970,12 +4431,34 @@ def main(dev_mode: bool = False):
         regionless_fish_profiles=event_fish_profiles,
     )
 
-    def unlocked_pool_keys() -> set[str]:
-        keys = set(unlocked_pools)
-        for pool in pools:
-            if pool.name in unlocked_pools:
-                keys.add(pool.folder.name)
-        return keys
+    # Chaves derivadas de unlocked_pools; quem altera o set (select_pool,
+    # missoes, dev tools) chama mark_unlocked_pools_dirty().
+    unlocked_pool_keys_cache: frozenset[str] = frozenset()
+    unlocked_pool_market_keys_cache: frozenset[str] = frozenset()
+    unlocked_pool_keys_dirty = True
+
+    def mark_unlocked_pools_dirty() -> None:
+        nonlocal unlocked_pool_keys_dirty
+        unlocked_pool_keys_dirty = True
+
+    def rebuild_unlocked_pool_keys_if_needed() -> None:
+        nonlocal unlocked_pool_keys_cache, unlocked_pool_market_keys_cache
+        nonlocal unlocked_pool_keys_dirty
+        if not unlocked_pool_keys_dirty:
+            return
+        unlocked_known_pools = unlocked_pools & all_pool_names
+        folder_names = {pool_folder_by_name[name] for name in unlocked_known_pools}
+        unlocked_pool_keys_cache = frozenset(unlocked_pools | folder_names)
+        unlocked_pool_market_keys_cache = frozenset(unlocked_known_pools | folder_names)
+        unlocked_pool_keys_dirty = False
+
+    def unlocked_pool_keys() -> frozenset[str]:
+        rebuild_unlocked_pool_keys_if_needed()
+        return unlocked_pool_keys_cache
+
+    def unlocked_pool_market_keys() -> frozenset[str]:
+        rebuild_unlocked_pool_keys_if_needed()
+        return unlocked_pool_market_keys_cache
 
     inventory_fish_counts_cache: Dict[str, int] = {}
     inventory_mutation_counts_cache: Dict[str, int] = {}
@@ -3989,10 +4472,11 @@ def main(dev_mode: bool = False):
         nonlocal inventory_fish_counts_dirty
         if not inventory_fish_counts_dirty:
             return
+        fish_counts, mutation_counts = count_inventory_fish_and_mutations(inventory)
         inventory_fish_counts_cache.clear()
-        inventory_fish_counts_cache.update(count_inventory_fish(inventory))
+        inventory_fish_counts_cache.update(fish_counts)
         inventory_mutation_counts_cache.clear()
-        inventory_mutation_counts_cache.update(count_inventory_mutations(inventory))
+        inventory_mutation_counts_cache.update(mutation_counts)
         inventory_fish_counts_dirty = False
 
     def get_inventory_fish_counts() -> Dict[str, int]:
@@ -4053,9 +4537,10 @@ def main(dev_mode: bool = False):
         is_shiny: bool,
     ) -> None:
         mutation_name = mutation.name if mutation else None
-        mission_progress.record_fish_caught(fish.name, mutation_name, is_shiny)
-        crafting_progress.record_find(fish.name, mutation_name)
-        mark_inventory_fish_counts_dirty()
+        with deferred_exit_signals():
+            mission_progress.record_fish_caught(fish.name, mutation_name, is_shiny)
+            crafting_progress.record_find(fish.name, mutation_name)
+            mark_inventory_fish_counts_dirty()
 
     def on_market_appraise_completed(entry: InventoryEntry) -> List[str]:
         return _finalize_market_appraise(
@@ -4066,116 +4551,110 @@ def main(dev_mode: bool = False):
             mark_inventory_counts_dirty=mark_inventory_fish_counts_dirty,
         )
 
-    def apply_bestiary_reward(reward: BestiaryRewardDefinition) -> List[str]:
-        nonlocal balance, level, xp
-        notes: List[str] = []
-        rods_by_name = {rod.name: rod for rod in available_rods}
-        for reward_payload in reward.rewards:
-            reward_type = reward_payload.get("type")
-            if reward_type == "money":
-                try:
-                    amount = float(reward_payload.get("amount", 0.0))
-                except (TypeError, ValueError):
-                    amount = 0.0
-                if amount > 0:
-                    balance += amount
-                    mission_progress.record_money_earned(amount)
-                    notes.append(f"💰 +R$ {amount:0.2f}")
-                continue
-
-            if reward_type == "xp":
-                try:
-                    amount = int(reward_payload.get("amount", 0))
-                except (TypeError, ValueError):
-                    amount = 0
-                if amount > 0:
-                    level, xp, level_ups = apply_xp_gain(level, xp, amount)
-                    notes.append(f"✨ +{amount} XP")
-                    if level_ups:
-                        notes.append(f"⬆️ Subiu {level_ups} nivel(is)!")
-                continue
-
-            if reward_type == "fish":
-                fish_name = reward_payload.get("fish_name")
-                if not isinstance(fish_name, str):
-                    continue
-                fish_profile = fish_by_name.get(fish_name)
-                if fish_profile is None:
-                    continue
-                try:
-                    count = max(1, int(reward_payload.get("count", 1)))
-                except (TypeError, ValueError):
-                    count = 1
-                fixed_kg = reward_payload.get("kg")
-                for _ in range(count):
-                    if fixed_kg is not None:
-                        try:
-                            kg = float(fixed_kg)
-                        except (TypeError, ValueError):
-                            kg = fish_profile.kg_min
-                    elif fish_profile.kg_min == fish_profile.kg_max:
-                        kg = fish_profile.kg_min
-                    else:
-                        kg = random.uniform(fish_profile.kg_min, fish_profile.kg_max)
-                    inventory.append(
-                        InventoryEntry(
-                            name=fish_profile.name,
-                            rarity=fish_profile.rarity,
-                            kg=kg,
-                            base_value=fish_profile.base_value,
-                        )
-                    )
-                discovered_fish.add(fish_profile.name)
-                notes.append(f"🎣 +{count}x {fish_profile.name}")
-                continue
+    def grant_money_reward(reward_payload: Dict[str, object], notes: List[str]) -> None:
+        nonlocal balance
+        amount = safe_float(reward_payload.get("amount", 0.0))
+        if amount > 0:
+            balance += amount
+            mission_progress.record_money_earned(amount)
+            notes.append(f"💰 +R$ {amount:0.2f}")
+
+    def grant_xp_reward(reward_payload: Dict[str, object], notes: List[str]) -> None:
+        nonlocal level, xp
+        amount = safe_int(reward_payload.get("amount", 0))
+        if amount > 0:
+            level, xp, level_ups = apply_xp_gain(level, xp, amount)
+            notes.append(f"✨ +{amount} XP")
+            if level_ups:
+                notes.append(f"⬆️ Subiu {level_ups} nivel(is)!")
 
-            if reward_type == "bait":
-                bait_id = reward_payload.get("bait_id")
+    def grant_fish_reward(reward_payload: Dict[str, object], notes: List[str]) -> None:
+        fish_name = reward_payload.get("fish_name")
+        if not isinstance(fish_name, str):
+            return
+        fish_profile = fish_by_name.get(fish_name)
+        if fish_profile is None:
+            return
+        count = max(1, safe_int(reward_payload.get("count", 1)))
+        fixed_kg = reward_payload.get("kg")
+        for _ in range(count):
+            if fixed_kg is not None:
                 try:
-                    amount = int(reward_payload.get("amount", 0))
+                    kg = float(fixed_kg)
                 except (TypeError, ValueError):
-                    amount = 0
-                if (
-                    isinstance(bait_id, str)
-                    and bait_id in bait_by_id
-                    and amount > 0
-                ):
-                    bait_inventory[bait_id] = bait_inventory.get(bait_id, 0) + amount
-                    notes.append(f"🪱 +{amount}x {bait_by_id[bait_id].name}")
-                continue
+                    kg = fish_profile.kg_min
+            elif fish_profile.kg_min == fish_profile.kg_max:
+                kg = fish_profile.kg_min
+            else:
+                kg = random.uniform(fish_profile.kg_min, fish_profile.kg_max)
+            inventory.append(
+                InventoryEntry(
+                    name=fish_profile.name,
+                    rarity=fish_profile.rarity,
+                    kg=kg,
+                    base_value=fish_profile.base_value,
+                )
+            )
+        discovered_fish.add(fish_profile.name)
+        notes.append(f"🎣 +{count}x {fish_profile.name}")
+
+    def grant_bait_reward(reward_payload: Dict[str, object], notes: List[str]) -> None:
+        bait_id = reward_payload.get("bait_id")
+        amount = safe_int(reward_payload.get("amount", 0))
+        if isinstance(bait_id, str) and bait_id in bait_by_id and amount > 0:
+            bait_inventory[bait_id] += amount
+            notes.append(f"🪱 +{amount}x {bait_by_id[bait_id].name}")
+
+    def grant_rod_reward(reward_payload: Dict[str, object], notes: List[str]) -> None:
+        rod_name = reward_payload.get("rod_name")
+        if not isinstance(rod_name, str):
+            return
+        rod = rods_by_name.get(rod_name)
+        if rod is None:
+            return
+        was_unlocked = rod.name in unlocked_rods
+        unlocked_rods.add(rod.name)
+        if rod.name not in {owned.name for owned in owned_rods}:
+            owned_rods.append(rod)
+            notes.append(f"🪝 Vara adicionada: {rod.name}")
+        elif not was_unlocked:
+            notes.append(f"🪝 Vara desbloqueada: {rod.name}")
+
+    def grant_ui_color_reward(reward_payload: Dict[str, object], notes: List[str]) -> None:
+        color_id = reward_payload.get("color_id")
+        if not isinstance(color_id, str):
+            return
+        if unlock_ui_color(cosmetics_state, color_id):
+            color_def = UI_COLOR_DEFINITIONS[color_id]
+            notes.append(f"Nova cor desbloqueada: {color_def.name}")
 
-            if reward_type == "rod":
-                rod_name = reward_payload.get("rod_name")
-                if not isinstance(rod_name, str):
-                    continue
-                rod = rods_by_name.get(rod_name)
-                if rod is None:
-                    continue
-                was_unlocked = rod.name in unlocked_rods
-                unlocked_rods.add(rod.name)
-                if rod.name not in {owned.name for owned in owned_rods}:
-                    owned_rods.append(rod)
-                    notes.append(f"🪝 Vara adicionada: {rod.name}")
-                elif not was_unlocked:
-                    notes.append(f"🪝 Vara desbloqueada: {rod.name}")
-                continue
+    def grant_ui_icon_reward(reward_payload: Dict[str, object], notes: List[str]) -> None:
+        icon_id = reward_payload.get("icon_id")
+        if not isinstance(icon_id, str):
+            return
+        if unlock_ui_icon(cosmetics_state, icon_id):
+            icon_def = UI_ICON_DEFINITIONS[icon_id]
+            notes.append(f"Novo icone desbloqueado: {icon_def.name}")
+
+    bestiary_reward_handlers: Dict[str, Callable[[Dict[str, object], List[str]], None]] = {
+        "money": grant_money_reward,
+        "xp": grant_xp_reward,
+        "fish": grant_fish_reward,
+        "bait": grant_bait_reward,
+        "rod": grant_rod_reward,
+        "ui_color": grant_ui_color_reward,
+        "ui_icon": grant_ui_icon_reward,
+    }
 
-            if reward_type == "ui_color":
-                color_id = reward_payload.get("color_id")
-                if not isinstance(color_id, str):
-                    continue
-                if unlock_ui_color(cosmetics_state, color_id):
-                    color_def = UI_COLOR_DEFINITIONS[color_id]
-                    notes.append(f"Nova cor desbloqueada: {color_def.name}")
+    def apply_bestiary_reward(reward: BestiaryRewardDefinition) -> List[str]:
+        notes: List[str] = []
+        for reward_payload in reward.rewards:
+            reward_type = reward_payload.get("type")
+            if not isinstance(reward_type, str):
                 continue
-
-            if reward_type == "ui_icon":
-                icon_id = reward_payload.get("icon_id")
-                if not isinstance(icon_id, str):
-                    continue
-                if unlock_ui_icon(cosmetics_state, icon_id):
-                    icon_def = UI_ICON_DEFINITIONS[icon_id]
-                    notes.append(f"Novo icone desbloqueado: {icon_def.name}")
+            handler = bestiary_reward_handlers.get(reward_type)
+            if handler is not None:
+                handler(reward_payload, notes)
         return notes
 
     refresh_crafting_unlocks(print_notifications=False)
@@ -4197,11 +4676,36 @@ def main(dev_mode: bool = False):
         for signum in handled_signals
     }
 
+    exit_signal_defer_depth = 0
+    pending_exit_signal: Optional[str] = None
+
     def request_graceful_exit(signum, _frame):
-        signame = signal.Signals(signum).name if signum in signal.Signals.__members__.values() else str(signum)
+        nonlocal pending_exit_signal
+        try:
+            signame = signal.Signals(signum).name
+        except ValueError:
+            signame = str(signum)
+        if exit_signal_defer_depth:
+            # No meio de uma atualizacao de estado: sai quando ela terminar.
+            pending_exit_signal = signame
+            return
         print(f"\nRecebido {signame}. Salvando antes de sair...")
         raise KeyboardInterrupt
 
+    @contextmanager
+    def deferred_exit_signals():
+        nonlocal exit_signal_defer_depth, pending_exit_signal
+        exit_signal_defer_depth += 1
+        try:
+            yield
+        finally:
+            exit_signal_defer_depth -= 1
+        if not exit_signal_defer_depth and pending_exit_signal is not None:
+            signame = pending_exit_signal
+            pending_exit_signal = None
+            print(f"\nRecebido {signame}. Salvando antes de sair...")
+            raise KeyboardInterrupt
+
     for signum in handled_signals:
         signal.signal(signum, request_graceful_exit)
 
@@ -4209,6 +4713,11 @@ def main(dev_mode: bool = False):
         while True:
             loop_start = time.monotonic()
             play_time_recorded_for_loop = False
+            state_changed = True
+            if autosave_pending():
+                # Grava na hora o que ficou segurado pela janela do storage.
+                with deferred_exit_signals():
+                    autosave_current_state()
             active_event = event_manager.get_active_event()
             active_hunt = hunt_manager.get_active_hunt_for_pool(selected_pool.name)
             active_weather = weather_manager.get_active_weather()
@@ -4221,7 +4730,9 @@ def main(dev_mode: bool = False):
                 active_hunt,
                 dev_mode=dev_mode,
                 active_weather=active_weather,
+                notice=menu_notice,
             )
+            menu_notice = ""
             if choice == "1":
                 level, xp, equipped_bait_id = run_fishing_round(
                     selected_pool,
@@ -4244,8 +4755,8 @@ def main(dev_mode: bool = False):
                 )
                 mark_inventory_fish_counts_dirty()
             elif choice == "2":
-                clear_screen()
                 selected_pool = select_pool(pools, unlocked_pools)
+                mark_unlocked_pools_dirty()
             elif choice == "3":
                 equipped_rod, equipped_bait_id = show_inventory(
                     inventory,
@@ -4258,22 +4769,13 @@ def main(dev_mode: bool = False):
                     equipped_bait_id,
                     cosmetics_state,
                     on_cosmetics_changed=apply_active_cosmetics,
-                    on_storage_changed=autosave_current_state,
+                    on_storage_changed=autosave_after_storage_change,
                     hunt_fish_names=hunt_fish_names,
                     shiny_multiplier=shiny_config.value_multiplier,
                     shiny_label_text=shiny_config.display.label,
                     shiny_color=shiny_config.display.color,
                 )
             elif choice == "4":
-                unlocked_pool_market_keys = {
-                    pool.name
-                    for pool in pools
-                    if pool.name in unlocked_pools
-                } | {
-                    pool.folder.name
-                    for pool in pools
-                    if pool.name in unlocked_pools
-                }
                 balance, level, xp = show_market(
                     inventory,
                     balance,
@@ -4297,7 +4799,7 @@ def main(dev_mode: bool = False):
                     bait_by_id=bait_by_id,
                     pool_orders=pool_market_orders,
                     unlocked_rods=unlocked_rods,
-                    unlocked_pools=unlocked_pool_market_keys,
+                    unlocked_pools=unlocked_pool_market_keys(),
                     rod_upgrade_state=rod_upgrade_state,
                     on_money_earned=mission_progress.record_money_earned,
                     on_money_spent=mission_progress.record_money_spent,
@@ -4341,6 +4843,7 @@ def main(dev_mode: bool = False):
                     regionless_fish_profiles=event_fish_profiles,
                 )
                 mark_inventory_fish_counts_dirty()
+                mark_unlocked_pools_dirty()
             elif choice == "7" and dev_mode:
                 (
                     balance,
@@ -4375,6 +4878,7 @@ def main(dev_mode: bool = False):
                     weather_manager=weather_manager,
                 )
                 mark_inventory_fish_counts_dirty()
+                mark_unlocked_pools_dirty()
             elif choice == "0":
                 mission_progress.add_play_time(time.monotonic() - loop_start)
                 play_time_recorded_for_loop = True
@@ -4419,20 +4923,25 @@ def main(dev_mode: bool = False):
                 print("Saindo...")
                 break
             else:
-                print("Opção inválida.")
-                time.sleep(1)
+                menu_notice = "Opção inválida."
+                state_changed = False
             mission_progress.add_play_time(time.monotonic() - loop_start)
             play_time_recorded_for_loop = True
-            update_mission_completions(
-                missions,
-                mission_state,
-                mission_progress,
-                level=level,
-                pools=pools,
-                discovered_fish=discovered_fish,
-                regionless_fish_profiles=event_fish_profiles,
-            )
-            refresh_crafting_unlocks(print_notifications=True)
+            if not state_changed:
+                # Entrada invalida nao altera o jogo; o proximo menu valido
+                # recalcula missoes e receitas.
+                continue
+            with deferred_exit_signals():
+                update_mission_completions(
+                    missions,
+                    mission_state,
+                    mission_progress,
+                    level=level,
+                    pools=pools,
+                    discovered_fish=discovered_fish,
+                    regionless_fish_profiles=event_fish_profiles,
+                )
+                refresh_crafting_unlocks(print_notifications=True)
     except KeyboardInterrupt:
         if loop_start is not None and not play_time_recorded_for_loop:
             mission_progress.add_play_time(time.monotonic() - loop_start)
@@ -4482,6 +4991,13 @@ def main(dev_mode: bool = False):
         event_manager.stop()
         hunt_manager.stop()
         weather_manager.stop()
+        try:
+            # A escrita e atomica (tmp + os.replace): se estourar o prazo,
+            # o save anterior continua intacto.
+            if not flush_autosave(timeout_s=AUTOSAVE_EXIT_TIMEOUT_S):
+                print("Aviso: o save demorou demais para gravar; o anterior foi mantido.")
+        except OSError as exc:
+            print(f"Aviso: falha ao gravar o save ({save_path}): {exc}")
 
 
 if __name__ == "__main__":
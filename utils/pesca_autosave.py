@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import threading
+import time
 from pathlib import Path
 from typing import Dict, List, Optional, TYPE_CHECKING
 
@@ -15,7 +17,7 @@ from utils.market import serialize_pool_market_orders
 from utils.missions import MissionProgress, serialize_mission_progress, serialize_mission_state
 from utils.rods import Rod
 from utils.rod_upgrades import RodUpgradeState
-from utils.save_system import save_game
+from utils.save_system import save_game, write_save_payload
 
 if TYPE_CHECKING:
     from utils.bestiary_rewards import BestiaryRewardState
@@ -23,6 +25,107 @@ if TYPE_CHECKING:
     from utils.pesca import FishingPool
 
 
+class SaveWriter:
+    """Grava o save em segundo plano, guardando so o snapshot mais recente.
+
+    O JSON e gerado na thread principal (o estado do jogo nao e thread-safe);
+    aqui fica apenas a escrita em disco, que pode demorar em discos lentos.
+    Uma falha de escrita volta como OSError no proximo submit (ou no flush).
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._pending: Optional[tuple[Path, bytes]] = None
+        self._writing = False
+        self._error: Optional[OSError] = None
+        self._last_written: Dict[Path, bytes] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, save_path: Path, payload: bytes) -> None:
+        """Enfileira o snapshot; se a gravacao anterior falhou, levanta o OSError dela."""
+        with self._condition:
+            self._pending = (save_path, payload)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="save-writer",
+                    daemon=True,
+                )
+                self._thread.start()
+            self._condition.notify_all()
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def flush(self, timeout_s: Optional[float] = None) -> bool:
+        """Espera a gravacao pendente. Retorna False se o timeout estourar."""
+        with self._condition:
+            finished = self._condition.wait_for(
+                lambda: self._pending is None and not self._writing,
+                timeout=timeout_s,
+            )
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+        return finished
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._pending is None:
+                    self._condition.wait()
+                save_path, payload = self._pending
+                self._pending = None
+                self._writing = True
+            try:
+                # Nada mudou desde a ultima gravacao: evita reescrever o arquivo.
+                if self._last_written.get(save_path) != payload:
+                    write_save_payload(save_path, payload)
+                    self._last_written[save_path] = payload
+            except OSError as exc:
+                with self._condition:
+                    self._error = exc
+            else:
+                # O disco ja tem o snapshot atual; erro antigo nao vale mais.
+                with self._condition:
+                    self._error = None
+            finally:
+                with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()
+
+
+_SAVE_WRITER = SaveWriter()
+
+# Movimentos seguidos no storage disparam varios autosaves (debounce=True);
+# dentro desta janela o estado so fica pendente e a proxima gravacao normal
+# (o topo do menu principal, por exemplo) grava na hora.
+AUTOSAVE_MIN_INTERVAL_S = 10.0
+_last_autosave_at: Optional[float] = None
+_autosave_dirty = False
+
+# discovered_fish e discovered_shiny_fish so recebem nomes novos durante a
+# sessao; enquanto o tamanho nao muda, a lista ordenada anterior continua valida.
+_SORTED_NAMES_CACHE: Dict[str, tuple[set[str], List[str]]] = {}
+
+
+def _sorted_grow_only_names(cache_key: str, names: set[str]) -> List[str]:
+    cached = _SORTED_NAMES_CACHE.get(cache_key)
+    if cached is not None and cached[0] is names and len(cached[1]) == len(names):
+        return cached[1]
+    sorted_names = sorted(names)
+    _SORTED_NAMES_CACHE[cache_key] = (names, sorted_names)
+    return sorted_names
+
+
+def flush_autosave(timeout_s: Optional[float] = None) -> bool:
+    return _SAVE_WRITER.flush(timeout_s)
+
+
+def autosave_pending() -> bool:
+    return _autosave_dirty
+
+
 def autosave_state(
     save_path: Path,
     balance: float,
@@ -49,7 +152,18 @@ def autosave_state(
     hunt_manager: Optional["HuntManager"],
     serialize_bestiary_reward_state,
     discovered_shiny_fish: Optional[set[str]] = None,
+    debounce: bool = False,
 ) -> None:
+    global _last_autosave_at, _autosave_dirty
+    now = time.monotonic()
+    if (
+        debounce
+        and _last_autosave_at is not None
+        and now - _last_autosave_at < AUTOSAVE_MIN_INTERVAL_S
+    ):
+        _autosave_dirty = True
+        return
+
     save_game(
         save_path,
         balance=balance,
@@ -62,7 +176,7 @@ def autosave_state(
         unlocked_rods=sorted(unlocked_rods),
         level=level,
         xp=xp,
-        discovered_fish=sorted(discovered_fish),
+        discovered_fish=_sorted_grow_only_names("discovered_fish", discovered_fish),
         mission_state=serialize_mission_state(mission_state),
         mission_progress=serialize_mission_progress(mission_progress),
         crafting_state=serialize_crafting_state(crafting_state),
@@ -74,5 +188,12 @@ def autosave_state(
         bestiary_reward_state=serialize_bestiary_reward_state(bestiary_reward_state),
         cosmetics_state=serialize_cosmetics_state(cosmetics_state),
         rod_upgrade_state=rod_upgrade_state,
-        discovered_shiny_fish=sorted(discovered_shiny_fish) if discovered_shiny_fish else [],
+        discovered_shiny_fish=(
+            _sorted_grow_only_names("discovered_shiny_fish", discovered_shiny_fish)
+            if discovered_shiny_fish
+            else []
+        ),
+        write_payload=_SAVE_WRITER.submit,
     )
+    _last_autosave_at = now
+    _autosave_dirty = False
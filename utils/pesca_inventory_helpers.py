@@ -15,13 +15,13 @@ def sanitize_equipped_bait(
     bait_inventory: Dict[str, int],
     bait_by_id: Dict[str, BaitDefinition],
 ) -> Optional[str]:
-    if not equipped_bait_id:
-        return None
-    if equipped_bait_id not in bait_by_id:
-        return None
-    if bait_inventory.get(equipped_bait_id, 0) <= 0:
-        return None
-    return equipped_bait_id
+    if (
+        equipped_bait_id
+        and bait_inventory.get(equipped_bait_id, 0) > 0
+        and equipped_bait_id in bait_by_id
+    ):
+        return equipped_bait_id
+    return None
 
 
 def list_owned_baits(
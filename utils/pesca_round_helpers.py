@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from itertools import chain
 from typing import Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
 
 from utils.baits import BaitDefinition
@@ -15,14 +16,13 @@ def resolve_active_bait(
     bait_by_id: Dict[str, BaitDefinition],
     equipped_bait_id: Optional[str],
 ) -> tuple[Optional[str], Optional[BaitDefinition], int]:
-    if equipped_bait_id and (
-        equipped_bait_id not in bait_by_id
-        or bait_inventory.get(equipped_bait_id, 0) <= 0
-    ):
+    if not equipped_bait_id:
+        return equipped_bait_id, None, 0
+    active_bait = bait_by_id.get(equipped_bait_id)
+    active_bait_quantity = bait_inventory.get(equipped_bait_id, 0)
+    if active_bait is None or active_bait_quantity <= 0:
         bait_inventory.pop(equipped_bait_id, None)
-        equipped_bait_id = None
-    active_bait = bait_by_id.get(equipped_bait_id) if equipped_bait_id else None
-    active_bait_quantity = bait_inventory.get(equipped_bait_id, 0) if equipped_bait_id else 0
+        return None, None, 0
     return equipped_bait_id, active_bait, active_bait_quantity
 
 
@@ -30,12 +30,11 @@ def calculate_effective_rod_stats(
     equipped_rod: "Rod",
     active_bait: Optional[BaitDefinition],
 ) -> tuple[float, float, float]:
-    bait_control = active_bait.control if active_bait else 0.0
-    bait_luck = active_bait.luck if active_bait else 0.0
-    bait_kg_plus = active_bait.kg_plus if active_bait else 0.0
-    effective_control = equipped_rod.control + bait_control
-    effective_luck = equipped_rod.luck + bait_luck
-    effective_kg_max = max(0.01, equipped_rod.kg_max + bait_kg_plus)
+    if not active_bait:
+        return equipped_rod.control, equipped_rod.luck, max(0.01, equipped_rod.kg_max)
+    effective_control = equipped_rod.control + active_bait.control
+    effective_luck = equipped_rod.luck + active_bait.luck
+    effective_kg_max = max(0.01, equipped_rod.kg_max + active_bait.kg_plus)
     return effective_control, effective_luck, effective_kg_max
 
 
@@ -44,13 +43,9 @@ def combine_fish_profiles(
     event_def: Optional["EventDefinition"],
     hunt_fish_profiles: Optional[Sequence["FishProfile"]],
 ) -> List["FishProfile"]:
-    event_fish = event_def.fish_profiles if event_def else []
-    hunt_fish = list(hunt_fish_profiles or [])
-    return (
-        list(selected_pool.fish_profiles)
-        + list(event_fish)
-        + list(hunt_fish)
-    )
+    event_fish = event_def.fish_profiles if event_def else ()
+    hunt_fish = hunt_fish_profiles or ()
+    return list(chain(selected_pool.fish_profiles, event_fish, hunt_fish))
 
 
 def filter_eligible_fish(
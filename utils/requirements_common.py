@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Callable, Dict, Mapping, Optional, Sequence, Set
+from functools import lru_cache
+from typing import Callable, Dict, Mapping, Optional, Sequence, Set, Tuple
 
 
 def safe_float(value: object) -> float:
@@ -22,15 +23,32 @@ def safe_str(value: object, *, fallback: str = "") -> str:
 
 
 def fish_name_matches(actual_name: str, expected_name: str) -> bool:
+    if actual_name == expected_name:
+        return True
     return actual_name.casefold() == expected_name.casefold()
 
 
+# Os mesmos nomes de peixe/mutacao sao reavaliados a cada checagem de
+# missao/receita; guarda o casefold (e o split do par) de cada chave.
+@lru_cache(maxsize=4096)
+def _casefold(text: str) -> str:
+    return text.casefold()
+
+
+@lru_cache(maxsize=4096)
+def _split_fish_mutation_key(pair_key: str) -> Optional[Tuple[str, str, str]]:
+    fish_part, separator, mutation_part = pair_key.partition("::")
+    if separator != "::":
+        return None
+    return fish_part.casefold(), mutation_part, mutation_part.casefold()
+
+
 def count_name_case_insensitive(counts: Mapping[str, int], name: str) -> int:
-    normalized_name = name.casefold()
+    normalized_name = _casefold(name)
     return sum(
         count
         for key, count in counts.items()
-        if key.casefold() == normalized_name
+        if _casefold(key) == normalized_name
     )
 
 
@@ -45,18 +63,19 @@ def count_fish_mutation_pair(
     mutation_name: Optional[str],
     mutation_case_insensitive: bool = False,
 ) -> int:
-    normalized_fish_name = fish_name.casefold() if fish_name else None
-    normalized_mutation_name = mutation_name.casefold() if mutation_case_insensitive and mutation_name else None
+    normalized_fish_name = _casefold(fish_name) if fish_name else None
+    normalized_mutation_name = _casefold(mutation_name) if mutation_case_insensitive and mutation_name else None
     total = 0
     for pair_key, count in counts.items():
-        fish_part, separator, mutation_part = pair_key.partition("::")
-        if separator != "::":
+        split_key = _split_fish_mutation_key(pair_key)
+        if split_key is None:
             continue
-        if normalized_fish_name and fish_part.casefold() != normalized_fish_name:
+        fish_part, mutation_part, normalized_mutation_part = split_key
+        if normalized_fish_name and fish_part != normalized_fish_name:
             continue
         if mutation_name:
             if mutation_case_insensitive:
-                if mutation_part.casefold() != normalized_mutation_name:
+                if normalized_mutation_part != normalized_mutation_name:
                     continue
             elif mutation_part != mutation_name:
                 continue
@@ -64,17 +83,25 @@ def count_fish_mutation_pair(
     return total
 
 
+# Ordem de prioridade das chaves de tempo e o fator para segundos.
+_TIME_KEYS: Tuple[Tuple[str, float], ...] = (
+    ("seconds", 1.0),
+    ("minutes", 60.0),
+    ("hours", 3600.0),
+)
+_MISSING = object()
+
+
 def seconds_from_requirement(
     requirement: Dict[str, object],
     *,
     clamp_non_negative: bool = False,
 ) -> float:
-    if "seconds" in requirement:
-        value = safe_float(requirement.get("seconds"))
-    elif "minutes" in requirement:
-        value = safe_float(requirement.get("minutes")) * 60
-    elif "hours" in requirement:
-        value = safe_float(requirement.get("hours")) * 3600
+    for key, multiplier in _TIME_KEYS:
+        raw_value = requirement.get(key, _MISSING)
+        if raw_value is not _MISSING:
+            value = safe_float(raw_value) * multiplier
+            break
     else:
         value = safe_float(requirement.get("time_seconds"))
     return max(0.0, value) if clamp_non_negative else value
@@ -99,9 +126,13 @@ def collect_countable_fish_names(
             continue
         if not pool_counts_for_bestiary_completion(pool):
             continue
-        for fish in getattr(pool, "fish_profiles", []):
-            fish_name = safe_str(getattr(fish, "name", ""))
-            if fish_name and fish_counts_for_bestiary_completion(fish):
+        for fish in getattr(pool, "fish_profiles", ()):
+            fish_name = getattr(fish, "name", None)
+            if (
+                fish_name
+                and isinstance(fish_name, str)
+                and getattr(fish, "counts_for_bestiary_completion", True)
+            ):
                 fish_names.add(fish_name)
     return fish_names
 
@@ -112,6 +143,6 @@ def completion_percent(
 ) -> float:
     if not fish_names:
         return 0.0
-    discovered = sum(1 for fish_name in fish_names if fish_name in discovered_fish)
+    discovered = len(fish_names.intersection(discovered_fish))
     return (discovered / len(fish_names)) * 100
 
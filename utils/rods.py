@@ -1,8 +1,11 @@
 import json
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional
 
+from utils.json_io import loads_json_bytes, read_files_parallel
+
 
 def _parse_number(
     raw_value: object,
@@ -124,11 +127,13 @@ def load_rods(base_dir: Path) -> List[Rod]:
     if not base_dir.exists():
         raise FileNotFoundError(f"Diretório de varas não encontrado: {base_dir}")
 
+    rod_paths = sorted(base_dir.glob("*.json"))
     rods: List[Rod] = []
-    for rod_path in sorted(base_dir.glob("*.json")):
+    for rod_path, raw_data in zip(rod_paths, read_files_parallel(rod_paths)):
         try:
-            with rod_path.open("r", encoding="utf-8") as handle:
-                data = json.load(handle)
+            if isinstance(raw_data, OSError):
+                raise raw_data
+            data = loads_json_bytes(raw_data)
         except (OSError, json.JSONDecodeError) as exc:
             print(f"Aviso: vara ignorada ({rod_path}): {exc}")
             continue
@@ -139,9 +144,11 @@ def load_rods(base_dir: Path) -> List[Rod]:
         name = data.get("name")
         if not name:
             continue
+        if isinstance(name, str):
+            name = sys.intern(name)
         raw_unlocks_with_pool = data.get("unlockswithpool", data.get("unlocks_with_pool", ""))
         unlocks_with_pool = (
-            raw_unlocks_with_pool.strip()
+            sys.intern(raw_unlocks_with_pool.strip())
             if isinstance(raw_unlocks_with_pool, str)
             else ""
         )
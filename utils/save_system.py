@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import json
+import os
+import sys
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Set, TYPE_CHECKING
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, TYPE_CHECKING
 
 from utils.inventory import InventoryEntry
+from utils.json_io import loads_json_bytes
 from utils.rods import Rod
 from utils.rod_upgrades import RodUpgradeState
 
@@ -13,33 +17,41 @@ if TYPE_CHECKING:
     from utils.pesca import FishingPool
 
 
-SAVE_VERSION = 11
+SAVE_VERSION = 12
 SAVE_FILE_NAME = "savegame.json"
 
+# Sem indent o json usa o encoder em C, bem mais rapido nos autosaves.
+_SAVE_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
 
 def get_default_save_path() -> Path:
     return Path(__file__).resolve().parent.parent / SAVE_FILE_NAME
 
 
-def serialize_inventory(inventory: Sequence[InventoryEntry]) -> List[Dict[str, object]]:
-    return [
-        {
-            "name": entry.name,
-            "rarity": entry.rarity,
-            "kg": entry.kg,
-            "base_value": entry.base_value,
-            "is_shiny": entry.is_shiny,
-            "mutation_name": entry.mutation_name,
-            "mutation_xp_multiplier": entry.mutation_xp_multiplier,
-            "mutation_gold_multiplier": entry.mutation_gold_multiplier,
-            "is_hunt": entry.is_hunt,
-            "is_unsellable": entry.is_unsellable,
-        }
-        for entry in inventory
-    ]
+INVENTORY_FIELDS = (
+    "name",
+    "rarity",
+    "kg",
+    "base_value",
+    "is_shiny",
+    "mutation_name",
+    "mutation_xp_multiplier",
+    "mutation_gold_multiplier",
+    "is_hunt",
+    "is_unsellable",
+)
+
+
+def serialize_inventory(inventory: Sequence[InventoryEntry]) -> Dict[str, List[object]]:
+    # Formato em colunas (v12+): os nomes dos campos aparecem uma vez so,
+    # nao uma vez por peixe.
+    return {
+        field_name: list(map(attrgetter(field_name), inventory))
+        for field_name in INVENTORY_FIELDS
+    }
 
 
-def serialize_storage(storage: Sequence[InventoryEntry]) -> List[Dict[str, object]]:
+def serialize_storage(storage: Sequence[InventoryEntry]) -> Dict[str, List[object]]:
     return serialize_inventory(storage)
 
 
@@ -83,6 +95,7 @@ def save_game(
     cosmetics_state: Optional[Dict[str, object]] = None,
     rod_upgrade_state: Optional[RodUpgradeState] = None,
     discovered_shiny_fish: Optional[Sequence[str]] = None,
+    write_payload: Optional[Callable[[Path, bytes], None]] = None,
 ) -> None:
     data = {
         "version": SAVE_VERSION,
@@ -126,17 +139,23 @@ def save_game(
         ),
         "discovered_shiny_fish": list(discovered_shiny_fish) if discovered_shiny_fish else [],
     }
-    save_path.write_text(
-        json.dumps(data, indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    payload = _SAVE_ENCODER.encode(data).encode("utf-8")
+    (write_payload or write_save_payload)(save_path, payload)
+
+
+def write_save_payload(save_path: Path, payload: bytes) -> None:
+    # Grava num arquivo temporario e troca de uma vez: se o processo morrer
+    # no meio da escrita, o save anterior continua intacto.
+    tmp_path = save_path.with_name(f"{save_path.name}.tmp")
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, save_path)
 
 
 def load_game(save_path: Path) -> Optional[Dict[str, object]]:
     if not save_path.exists():
         return None
     try:
-        raw = json.loads(save_path.read_text(encoding="utf-8"))
+        raw = loads_json_bytes(save_path.read_bytes())
     except (OSError, json.JSONDecodeError):
         return None
     if not isinstance(raw, dict):
@@ -144,11 +163,33 @@ def load_game(save_path: Path) -> Optional[Dict[str, object]]:
     return raw
 
 
+def _inventory_rows_from_columns(raw_columns: Dict[str, Any]) -> List[Dict[str, Any]]:
+    names = raw_columns.get("name")
+    if not isinstance(names, list):
+        return []
+    columns = {
+        field_name: raw_columns[field_name]
+        for field_name in INVENTORY_FIELDS
+        if isinstance(raw_columns.get(field_name), list)
+    }
+    # Coluna curta (save editado a mao) so deixa o campo no valor padrao.
+    return [
+        {
+            field_name: column[index]
+            for field_name, column in columns.items()
+            if index < len(column)
+        }
+        for index in range(len(names))
+    ]
+
+
 def _restore_inventory_entries(
     raw_entries: Any,
     *,
     allowed_names: Optional[Set[str]] = None,
 ) -> List[InventoryEntry]:
+    if isinstance(raw_entries, dict):
+        raw_entries = _inventory_rows_from_columns(raw_entries)
     if not isinstance(raw_entries, list):
         return []
 
@@ -161,9 +202,11 @@ def _restore_inventory_entries(
             continue
         if allowed_names is not None and name not in allowed_names:
             continue
+        # Internados, os nomes restaurados coincidem por identidade com os do
+        # catalogo nos lookups de bestiario/missoes.
+        name = sys.intern(name)
         rarity = item.get("rarity", "")
-        if not isinstance(rarity, str):
-            rarity = ""
+        rarity = sys.intern(rarity) if isinstance(rarity, str) else ""
         try:
             kg = float(item.get("kg", 0.0))
             base_value = float(item.get("base_value", 0.0))
@@ -172,7 +215,9 @@ def _restore_inventory_entries(
         raw_is_shiny = item.get("is_shiny", False)
         is_shiny = raw_is_shiny if isinstance(raw_is_shiny, bool) else False
         mutation_name = item.get("mutation_name")
-        if mutation_name is not None and not isinstance(mutation_name, str):
+        if isinstance(mutation_name, str):
+            mutation_name = sys.intern(mutation_name)
+        elif mutation_name is not None:
             mutation_name = None
         try:
             mutation_xp_multiplier = float(item.get("mutation_xp_multiplier", 1.0))
@@ -225,11 +270,13 @@ def restore_owned_rods(
         return [starter_rod]
 
     restored: List[Rod] = []
+    seen_names: Set[str] = set()
     for name in raw_rods:
         if not isinstance(name, str):
             continue
         rod = rod_by_name.get(name)
-        if rod and rod.name not in {r.name for r in restored}:
+        if rod and rod.name not in seen_names:
+            seen_names.add(rod.name)
             restored.append(rod)
 
     if not restored:
@@ -238,31 +285,45 @@ def restore_owned_rods(
     return restored
 
 
+def index_pools_by_name(pools: Sequence["FishingPool"]) -> Dict[str, "FishingPool"]:
+    # Primeira pool com o nome vence, como na busca linear.
+    pools_by_name: Dict[str, "FishingPool"] = {}
+    for pool in pools:
+        pools_by_name.setdefault(pool.name, pool)
+    return pools_by_name
+
+
 def restore_selected_pool(
     raw_pool: object,
     pools: Sequence["FishingPool"],
     fallback_pool: "FishingPool",
+    *,
+    pools_by_name: Optional[Dict[str, "FishingPool"]] = None,
 ) -> "FishingPool":
-    if isinstance(raw_pool, str):
-        for pool in pools:
-            if pool.name == raw_pool:
-                return pool
-    return fallback_pool
+    if not isinstance(raw_pool, str):
+        return fallback_pool
+    if pools_by_name is None:
+        pools_by_name = index_pools_by_name(pools)
+    return pools_by_name.get(raw_pool, fallback_pool)
 
 
 def restore_unlocked_pools(
     raw_pools: object,
     pools: Sequence["FishingPool"],
     selected_pool: "FishingPool",
+    *,
+    pools_by_name: Optional[Dict[str, "FishingPool"]] = None,
 ) -> List[str]:
-    pool_names = {pool.name for pool in pools}
+    pool_names = pools_by_name.keys() if pools_by_name is not None else {pool.name for pool in pools}
     restored: List[str] = []
+    seen_names: Set[str] = set()
     if isinstance(raw_pools, list):
         for name in raw_pools:
-            if isinstance(name, str) and name in pool_names and name not in restored:
+            if isinstance(name, str) and name in pool_names and name not in seen_names:
+                seen_names.add(name)
                 restored.append(name)
 
-    if selected_pool.name not in restored:
+    if selected_pool.name not in seen_names:
         restored.append(selected_pool.name)
 
     return restored
@@ -1,11 +1,12 @@
 import os
-import re
-from typing import Iterable, List
+import sys
+from typing import Iterable, List, Optional
 
 from utils.modern_ui import MenuOption, print_menu_panel, use_modern_ui
 
 
-_OPTION_RE = re.compile(r"^(\d+)\.\s*(.+)$")
+# Mesma sequencia que o `clear` emite: cursor no topo, limpa a tela e o scrollback.
+_CLEAR_SEQUENCE = "\x1b[H\x1b[2J\x1b[3J"
 
 
 def _clean_menu_title(raw_title: str) -> str:
@@ -15,13 +16,30 @@ def _clean_menu_title(raw_title: str) -> str:
     return title
 
 
+def _parse_option_line(line: str) -> Optional[MenuOption]:
+    # Equivale a ^(\d+)\.\s*(.+)$ sobre a linha sem espacos, sem passar pelo regex.
+    number, dot, label = line.strip().partition(".")
+    if not dot or not number.isdecimal():
+        return None
+    label = label.lstrip()
+    if not label or "\n" in label:
+        return None
+    return MenuOption(number, label)
+
+
 def clear_screen():
-    os.system("cls" if os.name == "nt" else "clear")
+    # No console do Windows o VT pode estar desligado; la segue o `cls`.
+    if os.name == "nt":
+        os.system("cls")
+        return
+    # Fora do Windows escreve a sequencia direto em vez de abrir um shell.
+    sys.stdout.write(_CLEAR_SEQUENCE)
+    sys.stdout.flush()
 
 
 def print_spaced_lines(lines: Iterable[str], gap_lines: int = 1):
     """Imprime linhas com espacamento vertical para melhorar leitura em menus."""
-    line_list = list(lines)
+    line_list = lines if isinstance(lines, (list, tuple)) else list(lines)
     if not line_list:
         return
 
@@ -29,9 +47,9 @@ def print_spaced_lines(lines: Iterable[str], gap_lines: int = 1):
         headers: List[str] = []
         options: List[MenuOption] = []
         for line in line_list[1:]:
-            match = _OPTION_RE.match(line.strip())
-            if match:
-                options.append(MenuOption(match.group(1), match.group(2)))
+            option = _parse_option_line(line)
+            if option is not None:
+                options.append(option)
             else:
                 headers.append(line)
         if options:
@@ -45,4 +63,4 @@ def print_spaced_lines(lines: Iterable[str], gap_lines: int = 1):
             return
 
     separator = "\n" * max(1, gap_lines)
-    print(separator.join(line_list))
+    sys.stdout.write(separator.join(line_list) + "\n")